@@ -62,14 +62,23 @@ _KEY_MIGRATIONS: dict[str, str] = {
 }
 
 def _migrate_keys(data: dict) -> dict:
-    """Remap legacy category keys to current names in-place."""
+    """Return ``data`` with legacy category keys remapped to current names.
+
+    Changed sections are rebuilt rather than edited in place, since nested
+    dicts may be shared with the cache's in-process memo.
+    """
+    data = dict(data)
     for section in ("current_scores", "category_history", "category_metadata"):
         sub = data.get(section)
         if not isinstance(sub, dict):
             continue
-        for old_key, new_key in _KEY_MIGRATIONS.items():
-            if old_key in sub and new_key not in sub:
-                sub[new_key] = sub.pop(old_key)
+        renames = {
+            old_key: new_key
+            for old_key, new_key in _KEY_MIGRATIONS.items()
+            if old_key in sub and new_key not in sub
+        }
+        if renames:
+            data[section] = {renames.get(k, k): v for k, v in sub.items()}
     return data
 
 
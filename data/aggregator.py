@@ -9,19 +9,19 @@ This is the main entry point for data. It:
     2. Calls ``fetch_current()`` and ``fetch_history()`` on each
     3. Handles provider failures gracefully (logs error, continues)
     4. Assembles alerts from the NewsAPI provider
-    5. Computes regional risk scores (derived from category scores)
-    6. Returns everything in the shape the layout expects
+    5. Returns everything in the shape the layout expects
 """
 
 from __future__ import annotations
 
+import concurrent.futures
 import logging
 from datetime import datetime
 
 import numpy as np
 import pandas as pd
 
-from config import CATEGORY_LABELS, CATEGORY_WEIGHTS, HISTORY_DAYS, REGIONS
+from config import CATEGORY_LABELS, CATEGORY_WEIGHTS, HISTORY_DAYS
 from data.ports_data import MAJOR_PORTS
 
 from data.providers.energy import EnergyProvider
@@ -33,10 +33,13 @@ from data.providers.weather import WeatherProvider
 from data.port_analyst import generate_port_summaries
 from data.ai_validator import validate_score
 from scoring import get_health_tier
+from scoring.engine import compute_composite_index
 
 logger = logging.getLogger(__name__)
 
-# All providers, instantiated once
+# All providers, instantiated once and shared across aggregate_data calls.
+# Providers hold no per-instance state (HTTP calls and caching live in
+# module-level helpers), so reusing them from worker threads is safe.
 _PROVIDERS = [
     WeatherProvider(),
     SupplyChainProvider(),
@@ -63,24 +66,32 @@ def _fetch_market_data() -> dict:
     if cached: 
         return cached
     
-    data = {}
-    for name, sym in tickers.items():
+    def _fetch_quote(sym: str) -> dict | None:
         try:
-            t = yf.Ticker(sym)
-            hist = t.history(period="5d")
-            if not hist.empty:
-                # Use scalar float() conversion to avoid numpy types
-                current = float(hist["Close"].iloc[-1])
-                prev = float(hist["Close"].iloc[-2]) if len(hist) > 1 else current
-                
-                data[name] = {
-                    "price": current,
-                    "prev": prev,
-                    "symbol": sym,
-                    "change_pct": ((current - prev) / prev) * 100 if prev else 0.0
-                }
+            hist = yf.Ticker(sym).history(period="5d")
+            if hist.empty:
+                return None
+            # Use scalar float() conversion to avoid numpy types
+            current = float(hist["Close"].iloc[-1])
+            prev = float(hist["Close"].iloc[-2]) if len(hist) > 1 else current
+            return {
+                "price": current,
+                "prev": prev,
+                "symbol": sym,
+                "change_pct": ((current - prev) / prev) * 100 if prev else 0.0
+            }
         except Exception as e:
             logger.warning(f"Market data fetch failed for {sym}: {e}")
+            return None
+
+    # Each ticker is an independent HTTPS round trip; fetch them together
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(tickers)) as executor:
+        quotes = executor.map(_fetch_quote, tickers.values())
+        data = {
+            name: quote
+            for name, quote in zip(tickers, quotes)
+            if quote is not None
+        }
             
     if data: 
         set_cached(cache_key, data)
@@ -101,8 +112,6 @@ def _make_fallback_series(days: int, name: str, value: float = 50.0) -> pd.Serie
 
 def get_safe_fallback_data() -> dict:
     """Return a completely safe, neutral dataset to ensure dashboard starts."""
-    from config import CATEGORY_WEIGHTS
-    
     current_scores = {cat: 50.0 for cat in CATEGORY_WEIGHTS}
     
     dates = pd.date_range(
@@ -355,22 +364,72 @@ def _fetch_provider_data(provider) -> tuple[str, float, pd.Series | None, dict,
             
         logger.info("Loaded %s: %.1f", cat, current_score)
     except Exception as exc:
-        logger.error("Provider %s failed (current): %s", cat, exc)
+        # exc_info lets the logging handler format the traceback lazily;
+        # the message itself is stringified once and shared below.
+        logger.error("Provider %s failed (current)", cat, exc_info=exc)
         error_msg = str(exc)
         current_score = 50.0
-        metadata = {"error": str(exc), "description": "Data fetch failed."}
+        metadata = {"error": error_msg, "description": "Data fetch failed."}
 
     try:
         # 2. Fetch history
         history_series = provider.fetch_history(HISTORY_DAYS)
     except Exception as exc:
-        logger.error("Provider %s failed (history): %s", cat, exc)
-        if not error_msg: 
+        logger.error("Provider %s failed (history)", cat, exc_info=exc)
+        if not error_msg:
             error_msg = str(exc)
         history_series = None
 
     return cat, current_score, history_series, metadata, error_msg
 
+def _short_title(title: str) -> str:
+    """Truncate a headline to 60 characters for the disruptions table."""
+    return title[:60] + "..." if len(title) > 60 else title
+
+
+def _derive_disruptions(
+    current_scores: dict[str, float],
+    alerts: list[dict],
+) -> list[dict]:
+    """Build the disruptions table from low category scores and high-severity news.
+
+    Both sources are plain ``list.extend`` calls over generators: the inputs
+    are small (one score per provider, a few dozen alerts), so building a
+    DataFrame would cost far more than the per-row work it replaces.
+    """
+    disruptions: list[dict] = []
+
+    # Source 1: Low-scoring categories
+    disruptions.extend(
+        {
+            "event": f"{CATEGORY_LABELS.get(cat, cat.title())} — {'Critical' if score < 40 else 'Stressed'}",
+            "region": "Global",
+            "impact_score": round((100 - score) / 10, 1),
+            "categories": [cat],
+            "started": "Ongoing",
+            "status": "Active" if score < 50 else "Monitoring",
+        }
+        for cat, score in current_scores.items()
+        if score < 70
+    )
+
+    # Source 2: High-severity news alerts
+    disruptions.extend(
+        {
+            "event": _short_title(alert.get("title", "Unknown event")),
+            "region": "Global",
+            "impact_score": round(abs(alert.get("sentiment", -0.5)) * 10, 1),
+            "categories": [alert.get("category", "geopolitical")],
+            "started": "Recent",
+            "status": "Active",
+        }
+        for alert in alerts
+        if alert.get("severity") == "high"
+    )
+
+    return disruptions
+
+
 def aggregate_data(status_callback=None) -> dict:
     """Fetch data from all providers and assemble the dashboard data dict.
 
@@ -390,8 +449,6 @@ def aggregate_data(status_callback=None) -> dict:
         ``"provider_errors"``  – dict[str, str]
         ``"market_data"``      – dict
     """
-    import concurrent.futures
-    
     start_time = datetime.now()
     logger.info("Starting parallel data fetch...")
     if status_callback: status_callback("Starting parallel data fetch...")
@@ -470,7 +527,7 @@ def aggregate_data(status_callback=None) -> dict:
                         
                 except Exception as e:
                     # This catches timeouts or crashes in the wrapper
-                    logger.error("A provider task failed unexpectedly: %s", e)
+                    logger.error("A provider task failed unexpectedly", exc_info=e)
         except concurrent.futures.TimeoutError:
             logger.warning("Data fetch timed out. Some providers may be missing.")
 
@@ -511,7 +568,6 @@ def aggregate_data(status_callback=None) -> dict:
             provider_errors[p.category] = "Provider timed out"
 
     # Compute composite
-    from scoring.engine import compute_composite_index
     composite = compute_composite_index(current_scores)
 
     # -----------------------------------------------------------------------
@@ -543,36 +599,7 @@ def aggregate_data(status_callback=None) -> dict:
         map_markers = []
 
     # Disruptions aggregation
-    disruptions: list[dict] = []
-
-    # Source 1: Low-scoring categories
-    for cat, score in current_scores.items():
-        if score < 70:
-            severity = "Critical" if score < 40 else "Stressed"
-            impact = round((100 - score) / 10, 1)
-            disruptions.append({
-                "event": f"{CATEGORY_LABELS.get(cat, cat.title())} — {severity}",
-                "region": "Global",
-                "impact_score": impact,
-                "categories": [cat],
-                "started": "Ongoing",
-                "status": "Active" if score < 50 else "Monitoring",
-            })
-
-    # Source 2: High-severity news alerts
-    for alert in alerts:
-        if alert.get("severity") == "high":
-            cat = alert.get("category", "geopolitical")
-            title = alert.get("title", "Unknown event")
-            short_title = title[:60] + "..." if len(title) > 60 else title
-            disruptions.append({
-                "event": short_title,
-                "region": "Global",
-                "impact_score": round(abs(alert.get("sentiment", -0.5)) * 10, 1),
-                "categories": [cat],
-                "started": "Recent",
-                "status": "Active",
-            })
+    disruptions = _derive_disruptions(current_scores, alerts)
 
     elapsed = (datetime.now() - start_time).total_seconds()
     logger.info("Data aggregation complete in %.2fs", elapsed)
@@ -4,22 +4,32 @@ AI Analyst Module
 Uses Google's Gemini API to analyze supply chain news.
 """
 from __future__ import annotations
-import json
+import functools
+import html
+import itertools
 import logging
 import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import google.generativeai as genai
 from dotenv import load_dotenv
 
+from data import ai_cache
+from data.cache import json_loads
+
 load_dotenv()
 logger = logging.getLogger(__name__)
 
-# Configure Gemini
+# Configure Gemini (lazily, on first model construction — see get_model)
 api_key = os.environ.get("GEMINI_API_KEY")
-if api_key:
-    genai.configure(api_key=api_key)
-else:
+if not api_key:
     logger.warning("GEMINI_API_KEY not found. AI analysis will be skipped.")
+_configured = False
+_configure_lock = threading.Lock()
+
+MODEL_NAME = "gemini-3-flash-preview"
 
 # Model configuration
 GENERATION_CONFIG = {
@@ -37,6 +47,14 @@ BRIEFING_CONFIG = {
     "response_mime_type": "text/plain",
 }
 
+# Full report configuration (Markdown)
+REPORT_CONFIG = {
+    "temperature": 0.3,
+    "top_p": 0.8,
+    "top_k": 40,
+    "response_mime_type": "text/plain",
+}
+
 SYSTEM_PROMPT = """
 You are an expert global supply chain risk analyst. 
 Your job is to analyze news headlines and determine if they are relevant to the GLOBAL COMMERCIAL SUPPLY CHAIN.
@@ -74,11 +92,126 @@ Constraint: NO JSON. NO MARKDOWN. NO TITLES. Each bullet should be a single, com
 Focus on: Disruptions, Risks, and Major Market Moves. Be punchy and concise."""
 
 
+REPORT_PROMPT = """
+You are the Chief Strategy Officer for a global logistics firm.
+Write a comprehensive "Daily Supply Chain Intelligence Report" based on the provided news headlines.
+
+Format: GitHub-flavored Markdown. Do NOT use any emojis whatsoever.
+
+Structure:
+Start immediately with the first section header (## Critical Disruptions). 
+Do NOT include any title, date, or meta-information like "To:", "From:", or "Subject:". 
+
+## Critical Disruptions
+[Identify the single most dangerous event (e.g., strikes, canal blocks). If none, say "No critical disruptions detected."]
+
+## Ocean Freight & Port Operations
+[Summarize port congestion, shipping rates, and carrier news]
+
+## Air & Land Logistics
+[Trucking, rail, and air cargo updates]
+
+## Market & Economic Context
+[Trade policy, tariffs, fuel prices, and demand signals]
+
+## Forward Outlook
+[What should supply chain managers watch for in the next 48 hours?]
+
+Constraints:
+- Use professional, executive tone.
+- Be specific (mention company names, ports, percentages).
+- Length: Approximately 400-600 words.
+- Do NOT use emojis anywhere.
+- Do NOT use "The news says" or "Article 1 says". Synthesize the information.
+"""
+
+
+# Model registries for get_model(). Keyed by short names so the cache key
+# stays hashable (generation configs are dicts). Other modules add their own
+# entries through register_model_config().
+_CONFIGS = {
+    "analysis": GENERATION_CONFIG,
+    "briefing": BRIEFING_CONFIG,
+    "report": REPORT_CONFIG,
+}
+_PROMPTS = {
+    "analysis": SYSTEM_PROMPT,
+    "report": REPORT_PROMPT,
+}
+
+
+def configure_gemini() -> bool:
+    """Configure the Gemini SDK once per process. Returns False if no key is set.
+
+    Every ``genai.configure()`` call drops the SDK's cached clients, and
+    with them the open gRPC (HTTP/2) channel to the API, so the next request
+    pays a fresh TLS handshake. All modules that talk to Gemini go through
+    this function instead of configuring the SDK themselves.
+    """
+    global _configured
+    if not api_key:
+        return False
+    with _configure_lock:
+        if not _configured:
+            genai.configure(api_key=api_key)
+            _configured = True
+    return True
+
+
+def register_model_config(
+    key: str, generation_config: dict | None, system_instruction: str | None = None
+) -> None:
+    """Register a generation config (and optional system prompt) under ``key``.
+
+    Call at import time, before the first ``get_model(..., key)``; models are
+    cached per key, so re-registering later has no effect on built models.
+    """
+    _CONFIGS[key] = generation_config
+    if system_instruction is not None:
+        _PROMPTS[key] = system_instruction
+
+
+@functools.lru_cache(maxsize=8)
+def get_model(
+    name: str, cfg_key: str, sys_key: str | None = None
+) -> genai.GenerativeModel:
+    """Return a shared ``GenerativeModel`` for this (model, config, prompt) combo.
+
+    Building a model object is not free (SDK client setup), and the three
+    generators below always ask for the same handful of combinations.
+    """
+    configure_gemini()
+    return genai.GenerativeModel(
+        model_name=name,
+        generation_config=_CONFIGS[cfg_key],
+        system_instruction=_PROMPTS.get(sys_key),
+    )
+
+
+_HTML_TAG = re.compile(r"<[^>]+>")
+_WHITESPACE = re.compile(r"\s+")
+
+# Descriptions past this length add prompt tokens without adding signal
+DESCRIPTION_CHAR_LIMIT = 240
+
+
+def _compact_text(text: str | None, limit: int = DESCRIPTION_CHAR_LIMIT) -> str:
+    """Strip HTML tags/entities, collapse whitespace and truncate for a prompt."""
+    if not text:
+        return ""
+    text = html.unescape(_HTML_TAG.sub(" ", text))
+    return _WHITESPACE.sub(" ", text).strip()[:limit]
+
+
 def analyze_news_batch(articles: list[dict]) -> tuple[dict[int, dict], str]:
     """
     Analyze a batch of articles using Gemini Flash.
     
     Returns both analysis AND briefing in a single API call to reduce usage.
+
+    Per-article analyses are memoized in ``data.ai_cache`` by a hash of the
+    article text, so only articles that have not been seen before are sent
+    to Gemini. The briefing is cached separately, keyed by the whole set.
     
     Args:
         articles: List of dicts checks {"id": int, "title": str, "description": str}
@@ -94,39 +227,75 @@ def analyze_news_batch(articles: list[dict]) -> tuple[dict[int, dict], str]:
     if not articles:
         return {}, ""
 
-    # detailed usage logging
-    logger.info(f"Sending {len(articles)} articles to Gemini for analysis + briefing...")
+    # IDs are positional and shift between refreshes, so key on the text only
+    keys = {
+        art["id"]: ai_cache.content_key(art["title"], art["description"])
+        for art in articles
+    }
+    briefing_key = ai_cache.content_key("briefing", *sorted(keys.values()))
+
+    hits = ai_cache.get_cached_many([*keys.values(), briefing_key])
+    analysis_map = {
+        aid: {**hits[key], "id": aid}
+        for aid, key in keys.items()
+        if key in hits
+    }
+    cached_briefing = hits.get(briefing_key)
+
+    missing = [art for art in articles if art["id"] not in analysis_map]
+    if not missing and cached_briefing is not None:
+        logger.info(f"All {len(articles)} articles served from AI cache.")
+        return analysis_map, cached_briefing
+    if not missing:
+        # Analyses are cached but the briefing is not — rebuild it from scratch
+        missing = articles
 
-    model = genai.GenerativeModel(
-        model_name="gemini-3-flash-preview",
-        generation_config=GENERATION_CONFIG,
-        system_instruction=SYSTEM_PROMPT
+    # detailed usage logging
+    logger.info(
+        f"Sending {len(missing)} articles to Gemini for analysis + briefing "
+        f"({len(articles) - len(missing)} cached)..."
     )
 
-    # Construct the user prompt
-    prompt_lines = ["Analyze these news items:"]
-    for art in articles:
-        prompt_lines.append(f"ID {art['id']}: {art['title']} - {art['description']}")
-    
-    prompt = "\n".join(prompt_lines)
+    model = get_model(MODEL_NAME, "analysis", "analysis")
+
+    # Already-analyzed headlines still belong in the briefing
+    missing_ids = {art["id"] for art in missing}
+    context = [art for art in articles if art["id"] not in missing_ids]
+
+    # Construct the user prompt in one join (no per-article list appends)
+    prompt = "\n".join(itertools.chain(
+        ["Analyze these news items:"],
+        (
+            f"ID {art['id']}: {art['title']} - {_compact_text(art['description'])}"
+            for art in missing
+        ),
+        ["\nAlready analyzed (use only as context for the briefing):"] if context else [],
+        (f"- {art['title']}" for art in context),
+    ))
 
     try:
         response = model.generate_content(prompt)
-        result = json.loads(response.text)
-        
+        result = json_loads(response.text)
+
         # Map back to ID
-        analysis_map = {}
+        new_entries = {}
         for item in result.get("analysis", []):
             analysis_map[item["id"]] = item
-        
+            if item["id"] in keys:
+                new_entries[keys[item["id"]]] = item
+
         # Extract briefing from same response (pre-generated)
         briefing = result.get("briefing", "")
+        if briefing:
+            new_entries[briefing_key] = briefing
+        ai_cache.set_cached_many(new_entries)
         
         return analysis_map, briefing
         
     except Exception as e:
         logger.error(f"Gemini API Analysis failed: {e}")
-        return {}, ""
+        # Keep whatever the cache already answered
+        return analysis_map, cached_briefing or ""
 
 def generate_briefing(articles: list[dict]) -> str:
     """
@@ -137,10 +306,7 @@ def generate_briefing(articles: list[dict]) -> str:
 
     logger.info(f"Generating briefing from {len(articles)} articles...")
     
-    model = genai.GenerativeModel(
-        model_name="gemini-3-flash-preview",
-        generation_config=BRIEFING_CONFIG,
-    )
+    model = get_model(MODEL_NAME, "briefing")
 
     prompt_lines = [
         "You are a global supply chain intelligence officer.",
@@ -152,10 +318,10 @@ def generate_briefing(articles: list[dict]) -> str:
         "\nHeadlines:"
     ]
     
-    for art in articles[:15]: # Limit context context
-        prompt_lines.append(f"- {art['title']}")
-        
-    prompt = "\n".join(prompt_lines)
+    prompt = "\n".join(itertools.chain(
+        prompt_lines,
+        (f"- {art['title']}" for art in articles[:15]),  # Limit context
+    ))
 
     try:
         response = model.generate_content(prompt)
@@ -165,39 +331,6 @@ def generate_briefing(articles: list[dict]) -> str:
         return "Global supply chain outlook is stable. No major disruptions reported at this time."
 
 
-REPORT_PROMPT = """
-You are the Chief Strategy Officer for a global logistics firm.
-Write a comprehensive "Daily Supply Chain Intelligence Report" based on the provided news headlines.
-
-Format: GitHub-flavored Markdown. Do NOT use any emojis whatsoever.
-
-Structure:
-Start immediately with the first section header (## Critical Disruptions). 
-Do NOT include any title, date, or meta-information like "To:", "From:", or "Subject:". 
-
-## Critical Disruptions
-[Identify the single most dangerous event (e.g., strikes, canal blocks). If none, say "No critical disruptions detected."]
-
-## Ocean Freight & Port Operations
-[Summarize port congestion, shipping rates, and carrier news]
-
-## Air & Land Logistics
-[Trucking, rail, and air cargo updates]
-
-## Market & Economic Context
-[Trade policy, tariffs, fuel prices, and demand signals]
-
-## Forward Outlook
-[What should supply chain managers watch for in the next 48 hours?]
-
-Constraints:
-- Use professional, executive tone.
-- Be specific (mention company names, ports, percentages).
-- Length: Approximately 400-600 words.
-- Do NOT use emojis anywhere.
-- Do NOT use "The news says" or "Article 1 says". Synthesize the information.
-"""
-
 def generate_full_report(articles: list[dict]) -> str:
     """
     Generate a long-form Markdown report from a large batch of articles.
@@ -207,16 +340,7 @@ def generate_full_report(articles: list[dict]) -> str:
 
     logger.info(f"Generating full report from {len(articles)} articles...")
     
-    model = genai.GenerativeModel(
-        model_name="gemini-3-flash-preview",
-        generation_config={
-            "temperature": 0.3,
-            "top_p": 0.8,
-            "top_k": 40,
-            "response_mime_type": "text/plain",
-        },
-        system_instruction=REPORT_PROMPT
-    )
+    model = get_model(MODEL_NAME, "report", "report")
 
     from zoneinfo import ZoneInfo
     prompt_lines = [
@@ -226,10 +350,13 @@ def generate_full_report(articles: list[dict]) -> str:
     ]
     
     # Use a larger context window for the full report (up to 40-50 headlines)
-    for art in articles[:50]:
-        prompt_lines.append(f"- {art['title']} ({art['source']}) - {art['description'][:100]}")
-        
-    prompt = "\n".join(prompt_lines)
+    prompt = "\n".join(itertools.chain(
+        prompt_lines,
+        (
+            f"- {art['title']} ({art['source']}) - {_compact_text(art['description'], 100)}"
+            for art in articles[:50]
+        ),
+    ))
 
     try:
         response = model.generate_content(prompt)
@@ -237,3 +364,34 @@ def generate_full_report(articles: list[dict]) -> str:
     except Exception as e:
         logger.error(f"Full report generation failed: {e}")
         return f"## Generation Failed\nError: {e}"
+
+
+def run_all_ai(
+    articles: list[dict],
+    report_articles: list[dict] | None = None,
+) -> tuple[dict[int, dict], str, str]:
+    """
+    Run the news analysis and the full report generation concurrently.
+
+    Both are independent, network-bound Gemini calls, so overlapping them
+    makes the total latency the slower of the two instead of their sum.
+    The briefing still comes from the combined analysis call, which keeps
+    API usage unchanged.
+
+    Args:
+        articles: Articles for ``analyze_news_batch`` (per-item analysis + briefing).
+        report_articles: Articles for ``generate_full_report``. Defaults to ``articles``.
+
+    Returns:
+        Tuple of (analysis_map, briefing_text, full_report_md)
+    """
+    if report_articles is None:
+        report_articles = articles
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        future_analysis = executor.submit(analyze_news_batch, articles)
+        future_report = executor.submit(generate_full_report, report_articles)
+        analysis_map, briefing = future_analysis.result()
+        full_report = future_report.result()
+
+    return analysis_map, briefing, full_report
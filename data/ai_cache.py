@@ -0,0 +1,138 @@
+"""
+AI Response Cache
+==================
+SQLite-backed memo store for Gemini responses.
+
+The JSON file cache in ``data/cache.py`` stores one file per key, which is
+fine for a handful of provider payloads but not for per-article analyses
+(hundreds of tiny entries). This module keeps them in a single SQLite file
+inside the same cache directory, keyed by a content hash so unchanged
+articles never need to be re-sent to the API.
+
+Usage
+-----
+>>> from data.ai_cache import content_key, get_cached_many, set_cached_many
+>>> key = content_key(title, description)
+>>> hits = get_cached_many([key])
+>>> if key not in hits:
+...     set_cached_many({key: analyse(title, description)})
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from typing import Any, Iterable
+
+from data.cache import _CACHE_DIR
+
+logger = logging.getLogger(__name__)
+
+_DB_PATH = _CACHE_DIR / "ai_cache.sqlite3"
+
+# Analyses are a pure function of the article text, so they can live for
+# a long time. Callers with fresher requirements pass their own TTL.
+DEFAULT_TTL_SECONDS = 7 * 86400
+
+# Rows older than this are deleted on write. No caller reads with a longer
+# TTL, so they can never be served again and would only grow the file.
+_MAX_AGE_SECONDS = DEFAULT_TTL_SECONDS
+
+_LOCK = threading.Lock()
+_CONN: sqlite3.Connection | None = None
+
+
+def _connect() -> sqlite3.Connection:
+    """Open (once) the shared connection and make sure the table exists."""
+    global _CONN
+    if _CONN is None:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        _CONN = sqlite3.connect(_DB_PATH, check_same_thread=False)
+        _CONN.execute(
+            "CREATE TABLE IF NOT EXISTS cache "
+            "(key TEXT PRIMARY KEY, ts REAL NOT NULL, value TEXT NOT NULL)"
+        )
+        _CONN.commit()
+    return _CONN
+
+
+def reset() -> None:
+    """Close the shared connection so the next call reopens the database.
+
+    Must be called before the cache directory is deleted; otherwise the
+    open handle keeps serving the unlinked file and every write fails.
+    """
+    global _CONN
+    with _LOCK:
+        if _CONN is not None:
+            try:
+                _CONN.close()
+            except Exception as e:
+                logger.warning("AI cache close failed: %s", e)
+            _CONN = None
+
+
+def content_key(*parts: Any) -> str:
+    """Return a short, stable hash of ``parts`` for use as a cache key."""
+    raw = "|".join("" if p is None else str(p) for p in parts)
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def get_cached_many(keys: Iterable[str], ttl: int = DEFAULT_TTL_SECONDS) -> dict[str, Any]:
+    """Return ``{key: value}`` for every key that is cached and fresh.
+
+    Missing or expired keys are simply absent from the result.
+    """
+    keys = list(dict.fromkeys(keys))
+    if not keys:
+        return {}
+
+    cutoff = time.time() - ttl
+    placeholders = ",".join("?" * len(keys))
+    try:
+        with _LOCK:
+            rows = _connect().execute(
+                f"SELECT key, value FROM cache WHERE ts > ? AND key IN ({placeholders})",
+                (cutoff, *keys),
+            ).fetchall()
+        return {key: json.loads(value) for key, value in rows}
+    except Exception as e:
+        logger.warning("AI cache read failed: %s", e)
+        return {}
+
+
+def get_cached(key: str, ttl: int = DEFAULT_TTL_SECONDS) -> Any | None:
+    """Return the cached value for a single key, or ``None``."""
+    return get_cached_many([key], ttl=ttl).get(key)
+
+
+def set_cached_many(items: dict[str, Any]) -> None:
+    """Insert or replace several entries in one transaction.
+
+    Expired rows are purged in the same transaction.
+    """
+    if not items:
+        return
+
+    now = time.time()
+    try:
+        rows = [(key, now, json.dumps(value, default=str)) for key, value in items.items()]
+        with _LOCK:
+            conn = _connect()
+            conn.executemany(
+                "INSERT OR REPLACE INTO cache (key, ts, value) VALUES (?, ?, ?)",
+                rows,
+            )
+            conn.execute("DELETE FROM cache WHERE ts < ?", (now - _MAX_AGE_SECONDS,))
+            conn.commit()
+    except Exception as e:
+        logger.warning("AI cache write failed: %s", e)
+
+
+def set_cached(key: str, value: Any) -> None:
+    """Insert or replace a single entry."""
+    set_cached_many({key: value})
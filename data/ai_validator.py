@@ -13,12 +13,23 @@ from __future__ import annotations
 
 import json
 import logging
-import os
-import google.generativeai as genai
 from datetime import datetime
 
+from data import ai_cache
+from data.cache import json_loads
+from data.ai_analyst import MODEL_NAME, api_key, get_model, register_model_config
+
 logger = logging.getLogger(__name__)
 
+if not api_key:
+    logger.warning("GEMINI_API_KEY not set. AI validation will be skipped.")
+
+# Validation runs with the SDK's default generation settings
+register_model_config("validation", None)
+
+# Validations are re-used while score, categories and headlines are unchanged
+VALIDATION_CACHE_TTL = 600
+
 # Fallback response if AI fails
 FALLBACK_VALIDATION = {
     "status": "Verified",
@@ -52,14 +63,22 @@ def validate_score(
             "adjustment": float (e.g. -2.5 or 0.0)
         }
     """
-    api_key = os.environ.get("GEMINI_API_KEY")
     if not api_key:
-        logger.warning("GEMINI_API_KEY not set. Skipping AI validation.")
         return FALLBACK_VALIDATION
 
+    cache_key = ai_cache.content_key(
+        "validate_score",
+        round(current_score, 1),
+        sorted((cat, round(score, 1)) for cat, score in current_categories.items()),
+        [(item.get("severity", "low"), item.get("title", "")) for item in top_news[:5]],
+    )
+    cached = ai_cache.get_cached(cache_key, ttl=VALIDATION_CACHE_TTL)
+    if cached is not None:
+        logger.info("Using cached AI validation.")
+        return cached
+
     try:
-        genai.configure(api_key=api_key)
-        model = genai.GenerativeModel('gemini-3-flash-preview')
+        model = get_model(MODEL_NAME, "validation")
 
         # Prepare context for the LLM
         news_summary = "\n".join([
@@ -101,7 +120,7 @@ def validate_score(
         if text.endswith("```"):
             text = text[:-3]
             
-        result = json.loads(text)
+        result = json_loads(text)
         
         # Safety bounds
         if not isinstance(result.get("adjustment"), (int, float)):
@@ -110,6 +129,7 @@ def validate_score(
         # Clamp adjustment to avoid AI hallucinations wrecking the dashboard
         result["adjustment"] = max(-5.0, min(5.0, float(result["adjustment"])))
         
+        ai_cache.set_cached(cache_key, result)
         return result
 
     except Exception as e:
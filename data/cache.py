@@ -17,58 +17,199 @@ Usage
 
 from __future__ import annotations
 
-import json
+import gzip
 import logging
+import mmap
 import os
 import pickle
+import shutil
 import tempfile
+import threading
 import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
-import numpy as np
+import orjson
 import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover
+    pa = None
+
 # Use /tmp in serverless environments (Vercel), otherwise local .cache
 if os.environ.get("VERCEL") or os.environ.get("AWS_LAMBDA_FUNCTION_NAME"):
     _CACHE_DIR = Path(tempfile.gettempdir()) / "supply_chain_cache"
 else:
     _CACHE_DIR = Path(__file__).parent / ".cache"
 
+# Create the directory once here rather than on every write; writers only
+# recreate it if it disappears at runtime (see _open_temp).
+try:
+    _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+except OSError as e:  # pragma: no cover
+    logging.getLogger(__name__).warning("Could not create cache dir %s: %s", _CACHE_DIR, e)
+
 # Default TTL: 1 hour. Override per call if needed.
 DEFAULT_TTL_SECONDS = 3600
 
+# Below this size a plain read() is cheaper than setting up a mapping.
+_MMAP_MIN_BYTES = 4096
+
+# In-process LRU memo of decoded cache files, keyed by path and validated
+# against the file's (mtime_ns, size) so a rewrite on disk is picked up.
+# Values are shared between callers and must be treated as read-only.
+_MEMO: OrderedDict[Path, tuple[tuple[int, int], Any]] = OrderedDict()
+_MEMO_MAX = 128
+_MEMO_LOCK = threading.Lock()
+_MISS = object()
+
+
+def _memo_get(path: Path, st: os.stat_result) -> Any:
+    """Return the memoized value for ``path`` or ``_MISS`` if stale/absent."""
+    with _MEMO_LOCK:
+        entry = _MEMO.get(path)
+        if entry is not None and entry[0] == (st.st_mtime_ns, st.st_size):
+            _MEMO.move_to_end(path)
+            return entry[1]
+    return _MISS
+
+
+def _memo_put(path: Path, st: os.stat_result, value: Any) -> None:
+    """Remember ``value`` for ``path``, evicting the least recently used entry when full."""
+    with _MEMO_LOCK:
+        _MEMO[path] = ((st.st_mtime_ns, st.st_size), value)
+        _MEMO.move_to_end(path)
+        if len(_MEMO) > _MEMO_MAX:
+            _MEMO.popitem(last=False)
+
 
 def _get_cache_path(key: str, ext: str = ".json") -> Path:
     """Return cache path for a key and extension."""
-    _CACHE_DIR.mkdir(parents=True, exist_ok=True)
     return _CACHE_DIR / f"{key}{ext}"
 
 
-def _write_text_atomic(path: Path, content: str) -> None:
-    """Atomically write text file to avoid torn writes."""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with tempfile.NamedTemporaryFile("w", dir=path.parent, delete=False) as tmp:
-        tmp.write(content)
-        tmp.flush()
-        os.fsync(tmp.fileno())
-        temp_name = tmp.name
+def _dumps(data: Any) -> bytes:
+    """Serialize ``data`` to JSON bytes."""
+    return orjson.dumps(
+        data,
+        default=str,
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+    )
+
+
+# Shared JSON parser for the data layer (API responses as well as cache files)
+json_loads = orjson.loads
+
+
+# The writers below rename a fully written temp file over the target, so
+# readers only ever see the old or the new contents. They deliberately
+# skip fsync: a cache entry lost to a power cut is simply re-fetched.
+
+def _open_temp(path: Path):
+    """Open a temp file next to ``path``, recreating the cache dir if needed."""
+    try:
+        return tempfile.NamedTemporaryFile("wb", dir=path.parent, delete=False)
+    except FileNotFoundError:
+        # Cold path: the directory was removed after import
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return tempfile.NamedTemporaryFile("wb", dir=path.parent, delete=False)
+
+
+def _write_bytes_atomic(path: Path, content: bytes) -> None:
+    """Atomically write a file to avoid torn writes.
+
+    The payload is already encoded, so it goes straight to the descriptor
+    with ``os.write`` rather than through a buffered file object.
+    """
+    try:
+        fd, temp_name = tempfile.mkstemp(dir=path.parent)
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(dir=path.parent)
+    try:
+        view = memoryview(content)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
     os.replace(temp_name, path)
 
 
 def _write_pickle_atomic(path: Path, data: Any) -> None:
     """Atomically write pickle file to avoid torn writes."""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with tempfile.NamedTemporaryFile("wb", dir=path.parent, delete=False) as tmp:
+    with _open_temp(path) as tmp:
         pickle.dump(data, tmp)
-        tmp.flush()
-        os.fsync(tmp.fileno())
         temp_name = tmp.name
     os.replace(temp_name, path)
 
 
+def _read_json(path: Path, size: int) -> Any:
+    """Parse a JSON cache file.
+
+    Large files are memory-mapped and handed to ``orjson`` directly, so the
+    bytes are never copied into an intermediate ``str``. Small files take
+    the ordinary read path.
+    Gzipped entries (``.json.gz``) are decompressed in memory first.
+
+    ``size`` comes from the caller's ``os.stat``, so the unmapped paths need
+    a single unbuffered ``os.read``. If the file was replaced in between,
+    the parse fails and the caller treats it as a miss.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        if path.suffix == ".gz":
+            raw = gzip.decompress(os.read(fd, size))
+        elif size < _MMAP_MIN_BYTES:
+            raw = os.read(fd, size)
+        else:
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return orjson.loads(view)
+    finally:
+        os.close(fd)
+    return orjson.loads(raw)
+
+
+def _get_cached_with_age(key: str, ttl: float) -> tuple[Any, float]:
+    """Shared lookup for :func:`get_cached` and :func:`get_cached_swr`.
+
+    Returns ``(value, age_seconds)``; ``value`` is ``None`` on a miss, an
+    expired entry, or a read error.
+    """
+    path = _get_cache_path(key, ext=".json")
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        # Only a miss pays for the second lookup of a compressed entry
+        path = _get_cache_path(key, ext=".json.gz")
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return None, 0.0
+
+    age = time.time() - st.st_mtime
+    if age > ttl:
+        return None, age
+
+    value = _memo_get(path, st)
+    if value is not _MISS:
+        return value, age
+
+    try:
+        value = _read_json(path, st.st_size)
+    except Exception as e:
+        logger.warning("Cache read failed for %s: %s", key, e)
+        return None, age
+
+    _memo_put(path, st, value)
+    return value, age
+
+
 def get_cached(key: str, ttl: int = DEFAULT_TTL_SECONDS) -> dict | list | None:
     """Return cached data if it exists and hasn't expired.
 
@@ -82,24 +223,46 @@ def get_cached(key: str, ttl: int = DEFAULT_TTL_SECONDS) -> dict | list | None:
     Returns
     -------
     dict | list | None
-        The cached data, or ``None`` if cache is missing or expired.
+        The cached data, or ``None`` if cache is missing or expired. The
+        object is shared through the in-process memo: treat it as read-only
+        and copy before modifying.
     """
-    path = _get_cache_path(key, ext=".json")
-    if not path.exists():
-        return None
+    return _get_cached_with_age(key, ttl)[0]
 
-    age_seconds = time.time() - path.stat().st_mtime
-    if age_seconds > ttl:
-        return None
 
-    try:
-        return json.loads(path.read_text())
-    except Exception as e:
-        logger.warning("Cache read failed for %s: %s", key, e)
-        return None
+def get_cached_swr(
+    key: str,
+    fresh_ttl: int,
+    stale_ttl: int,
+) -> tuple[dict | list | None, bool]:
+    """Stale-while-revalidate lookup.
 
+    Entries younger than ``fresh_ttl`` are fresh; entries between
+    ``fresh_ttl`` and ``stale_ttl`` are still returned but flagged stale,
+    so the caller can serve them immediately and refresh in the background.
 
-def set_cached(key: str, data: dict | list) -> None:
+    Parameters
+    ----------
+    key : str
+        Cache key.
+    fresh_ttl : int
+        Age in seconds up to which the entry needs no refresh.
+    stale_ttl : int
+        Age in seconds after which the entry is not served at all.
+
+    Returns
+    -------
+    tuple[dict | list | None, bool]
+        ``(data, is_stale)``; ``(None, False)`` if missing or too old.
+        As with :func:`get_cached`, ``data`` is shared and read-only.
+    """
+    value, age = _get_cached_with_age(key, stale_ttl)
+    if value is None:
+        return None, False
+    return value, age > fresh_ttl
+
+
+def set_cached(key: str, data: dict | list, compress: bool = False) -> None:
     """Write data to the cache.
 
     Parameters
@@ -108,17 +271,35 @@ def set_cached(key: str, data: dict | list) -> None:
         Cache key.
     data : dict | list
         JSON-serializable data to store.
+    compress : bool
+        Store as gzipped JSON (``{key}.json.gz``). Worthwhile for large,
+        text-heavy entries; :func:`get_cached` reads either form.
     """
-    path = _get_cache_path(key, ext=".json")
-    _write_text_atomic(path, json.dumps(data, default=str))
+    payload = _dumps(data)
+    plain_path = _get_cache_path(key, ext=".json")
+    if compress:
+        path = _get_cache_path(key, ext=".json.gz")
+        payload = gzip.compress(payload, compresslevel=3)
+        # A leftover plain entry would shadow the compressed one on read
+        _MEMO.pop(plain_path, None)
+        plain_path.unlink(missing_ok=True)
+    else:
+        path = plain_path
+    _MEMO.pop(path, None)
+    _write_bytes_atomic(path, payload)
 
 
 
 def clear_cache() -> None:
     """Delete all cached files. Useful for forcing a full refresh."""
-    if _CACHE_DIR.exists():
-        for f in _CACHE_DIR.glob("*"):
-            f.unlink()
+    # The AI store's SQLite file lives in the same directory; release its
+    # connection first (imported here: data.ai_cache imports this module).
+    from data import ai_cache
+
+    ai_cache.reset()
+    _MEMO.clear()
+    shutil.rmtree(_CACHE_DIR, ignore_errors=True)
+    _CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
 
 # ── Pickle Support for Complex Objects (DataFrames, etc.) ──────────────────
@@ -126,16 +307,21 @@ def clear_cache() -> None:
 def get_cached_pickle(key: str, ttl: int = 3600) -> Any | None:
     """Retrieve a pickled object from cache if it exists and is fresh."""
     filename = _get_cache_path(key, ext=".pkl")
-    if not filename.exists():
+    try:
+        st = os.stat(filename)
+    except FileNotFoundError:
         return None
-        
+
     try:
-        mod_time = filename.stat().st_mtime
-        if (time.time() - mod_time) > ttl:
+        if time.time() - st.st_mtime > ttl:
             return None
-            
-        with open(filename, "rb") as f:
-            return pickle.load(f)
+
+        value = _memo_get(filename, st)
+        if value is _MISS:
+            with open(filename, "rb") as f:
+                value = pickle.load(f)
+            _memo_put(filename, st, value)
+        return value
     except Exception as e:
         logger.warning(f"Cache miss (pickle error) for {key}: {e}")
         return None
@@ -144,51 +330,178 @@ def get_cached_pickle(key: str, ttl: int = 3600) -> Any | None:
 def set_cached_pickle(key: str, data: Any) -> None:
     """Save an object to cache using pickle."""
     filename = _get_cache_path(key, ext=".pkl")
+    _MEMO.pop(filename, None)
     try:
         _write_pickle_atomic(filename, data)
     except Exception as e:
         logger.warning(f"Failed to write cache (pickle) {key}: {e}")
 
 
+# ── Arrow IPC Support for pandas Series/DataFrames ─────────────────────────
+
+# Schema metadata flag marking a table that was written from a Series.
+_ARROW_SERIES_FLAG = b"gscindex.series"
+
+
+def _write_arrow_atomic(path: Path, table: "pa.Table") -> None:
+    """Atomically write an Arrow IPC file to avoid torn writes."""
+    with _open_temp(path) as tmp:
+        with pa.ipc.new_file(tmp, table.schema) as writer:
+            writer.write_table(table)
+        temp_name = tmp.name
+    os.replace(temp_name, path)
+
+
+def get_cached_arrow(key: str, ttl: int = DEFAULT_TTL_SECONDS) -> pd.Series | pd.DataFrame | None:
+    """Return a cached pandas object written by :func:`set_cached_arrow`.
+
+    The Arrow file is memory-mapped and rebuilt with its original index
+    (including ``DatetimeIndex``), so no date-string round trip is needed.
+    Falls back to the pickle cache when ``pyarrow`` is not installed.
+
+    Parameters
+    ----------
+    key : str
+        Cache key (used as filename, so keep it filesystem-safe).
+    ttl : int
+        Maximum age in seconds before the cache is considered stale.
+
+    Returns
+    -------
+    pd.Series | pd.DataFrame | None
+        The cached object, or ``None`` if cache is missing or expired.
+    """
+    if pa is None:
+        return get_cached_pickle(key, ttl=ttl)
+
+    path = _get_cache_path(key, ext=".arrow")
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+
+    if time.time() - st.st_mtime > ttl:
+        return None
+
+    value = _memo_get(path, st)
+    if value is not _MISS:
+        return value
+
+    try:
+        with pa.memory_map(str(path), "r") as source:
+            table = pa.ipc.open_file(source).read_all()
+        value = table.to_pandas(zero_copy_only=False)
+        if (table.schema.metadata or {}).get(_ARROW_SERIES_FLAG):
+            value = value.iloc[:, 0]
+    except Exception as e:
+        logger.warning("Cache read failed (arrow) for %s: %s", key, e)
+        return None
+
+    _memo_put(path, st, value)
+    return value
+
+
+def set_cached_arrow(key: str, data: pd.Series | pd.DataFrame) -> None:
+    """Save a pandas Series or DataFrame to cache as an Arrow IPC file.
+
+    Parameters
+    ----------
+    key : str
+        Cache key.
+    data : pd.Series | pd.DataFrame
+        Object to store; its index is preserved.
+    """
+    if pa is None:
+        set_cached_pickle(key, data)
+        return
+
+    path = _get_cache_path(key, ext=".arrow")
+    _MEMO.pop(path, None)
+    try:
+        if isinstance(data, pd.Series):
+            table = pa.Table.from_pandas(data.to_frame())
+            metadata = {**(table.schema.metadata or {}), _ARROW_SERIES_FLAG: b"1"}
+            table = table.replace_schema_metadata(metadata)
+        else:
+            table = pa.Table.from_pandas(data)
+        _write_arrow_atomic(path, table)
+    except Exception as e:
+        logger.warning("Failed to write cache (arrow) %s: %s", key, e)
+
+
+# The dashboard snapshot is stored as one small "meta" entry plus one shard
+# per category history, written and read concurrently.
+_DASHBOARD_KEY = "dashboard_snapshot_safe"
+_DASHBOARD_SHARD_PREFIX = "dashboard_hist_"
+_DASHBOARD_IO_WORKERS = 4
+
+
 def set_cached_dashboard(data: dict) -> None:
     """Save the full dashboard state as JSON (safe serialization).
     
     Converts complex types (Pandas Series/Index) to standard lists/strings
     to avoid pickle dependency issues on production servers.
+
+    Dates are stored as integer nanoseconds (``"dates_ns"``) rather than
+    formatted strings. ``orjson`` serializes the raw NumPy arrays directly
+    (NaN becomes ``null``), so no Python lists are built at all.
+
+    Each category history is written to its own shard in parallel, and the
+    meta entry listing them is written last. Meta and shards all carry the
+    same ``snapshot_id``; a reader that overlaps a writer can still pick up
+    a mix of old and new files, so :func:`get_cached_dashboard` treats any
+    mismatch as a miss rather than pairing histories with the wrong dates.
     """
     
     safe_data = data.copy()
     
-    # 1. Convert Index to list of strings
-    if "dates" in safe_data and isinstance(safe_data["dates"], pd.Index):
-        safe_data["dates"] = safe_data["dates"].strftime("%Y-%m-%d").tolist()
+    # 1. Convert DatetimeIndex to epoch nanoseconds
+    if "dates" in safe_data and isinstance(safe_data["dates"], pd.DatetimeIndex):
+        dates_ns = safe_data.pop("dates").as_unit("ns").asi8
+        safe_data["dates_ns"] = dates_ns
         
     # 2. Convert DataFrames/Series to primitive dictionaires/lists
     if "category_history" in safe_data:
-        # Convert {cat: Series} -> {cat: list[float]}
+        # Convert {cat: Series} -> {cat: float64 ndarray}. orjson's
+        # OPT_SERIALIZE_NUMPY writes the buffer directly and emits null for NaN.
         safe_history = {}
         for cat, series in safe_data["category_history"].items():
-            if isinstance(series, pd.Series):
-                safe_history[cat] = series.replace({np.nan: None}).tolist()
-            else:
+            if not isinstance(series, pd.Series):
                 safe_history[cat] = series
-        safe_data["category_history"] = safe_history
+            else:
+                safe_history[cat] = series.to_numpy(dtype=float)
+        snapshot_id = uuid.uuid4().hex
+        safe_data["history_shards"] = list(safe_history)
+        safe_data["snapshot_id"] = snapshot_id
+        del safe_data["category_history"]
+
+        with ThreadPoolExecutor(max_workers=_DASHBOARD_IO_WORKERS) as executor:
+            # list() re-raises any write error before the meta is written
+            list(executor.map(
+                lambda item: set_cached(
+                    _DASHBOARD_SHARD_PREFIX + item[0],
+                    {"snapshot_id": snapshot_id, "values": item[1]},
+                ),
+                safe_history.items(),
+            ))
 
-    set_cached("dashboard_snapshot_safe", safe_data)
+    set_cached(_DASHBOARD_KEY, safe_data)
 
 
 def reconstruct_dashboard_state(data: dict) -> dict:
     """Helper to reconstruct Pandas types from JSON-safe dashboard state."""
     try:
-        if "dates" in data and data["dates"]:
-             data["dates"] = pd.to_datetime(data["dates"])
+        if "dates_ns" in data:
+            data["dates"] = pd.to_datetime(data.pop("dates_ns"), unit="ns")
+        elif "dates" in data and data["dates"]:
+            # Snapshots written before dates_ns used "%Y-%m-%d" strings
+            data["dates"] = pd.to_datetime(data["dates"], format="%Y-%m-%d")
             
         if "category_history" in data and "dates" in data:
-            restored_history = {}
-            for cat, values in data["category_history"].items():
-                # Reconstruct Series using the datetime index
-                restored_history[cat] = pd.Series(values, index=data["dates"], name=cat)
-            data["category_history"] = restored_history
+            # One 2-D block sharing a single validated index; each column is
+            # then handed out as a named Series
+            frame = pd.DataFrame(data["category_history"], index=data["dates"], dtype="float64")
+            data["category_history"] = {cat: frame[cat] for cat in frame.columns}
         return data
     except Exception as e:
         logger.error(f"Failed to reconstruct dashboard state: {e}")
@@ -205,9 +518,31 @@ def get_cached_dashboard() -> dict | None:
     to the days-old committed snapshot every single time.
 
     Returns the reconstructed dashboard dict (with Pandas types restored),
-    or ``None`` if there is no cached snapshot or it has expired.
+    or ``None`` if there is no cached snapshot, it has expired, or its
+    history shards belong to a different snapshot.
     """
-    data = get_cached("dashboard_snapshot_safe", ttl=86400)
+    data = get_cached(_DASHBOARD_KEY, ttl=86400)
     if not data:
         return None
+    # Shallow copy: reconstruction replaces top-level keys, and the decoded
+    # snapshot is shared through the in-process memo.
+    data = dict(data)
+
+    shards = data.pop("history_shards", None)
+    if shards is not None:
+        with ThreadPoolExecutor(max_workers=_DASHBOARD_IO_WORKERS) as executor:
+            values = list(executor.map(
+                lambda cat: get_cached(_DASHBOARD_SHARD_PREFIX + cat, ttl=86400),
+                shards,
+            ))
+        if any(v is None for v in values):
+            logger.warning("Dashboard snapshot is missing history shards; ignoring it")
+            return None
+        snapshot_id = data.pop("snapshot_id", None)
+        if any(not isinstance(v, dict) or v.get("snapshot_id") != snapshot_id for v in values):
+            # Read overlapped a write: shards and meta come from different snapshots
+            logger.warning("Dashboard history shards do not match the snapshot; ignoring it")
+            return None
+        data["category_history"] = {cat: v["values"] for cat, v in zip(shards, values)}
+
     return reconstruct_dashboard_state(data)
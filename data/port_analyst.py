@@ -6,29 +6,33 @@ Cached for 12 hours (twice-daily updates) to minimize API costs.
 """
 from __future__ import annotations
 
-import json
 import logging
 import os
 from datetime import datetime
 
-import google.generativeai as genai
 from dotenv import load_dotenv
 
-from data.cache import get_cached, set_cached
+from data.ai_analyst import MODEL_NAME, get_model, register_model_config
+from data.cache import get_cached, json_loads, set_cached
 from data.ports_data import MAJOR_PORTS
 
 load_dotenv()
 logger = logging.getLogger(__name__)
 
-# Configure Gemini
 api_key = os.environ.get("GEMINI_API_KEY")
-if api_key:
-    genai.configure(api_key=api_key)
 
 # Cache TTL: 24 hours = 86400 seconds (reduced API usage)
 CACHE_TTL = 86400
 CACHE_KEY = "ai_port_summaries"
 
+# The port list never changes at runtime, so the prompt is built once
+_PORT_NAMES = tuple(name for name, *_ in MAJOR_PORTS)
+_PORT_PROMPT = (
+    "Analyze the current supply chain status for these major shipping ports:\n\n"
+    + "\n".join(f"- {name}" for name in _PORT_NAMES)
+    + "\n\nProvide a status summary for each port."
+)
+
 GENERATION_CONFIG = {
     "temperature": 0.7,  # Higher for more varied, specific responses
     "top_p": 0.9,
@@ -61,6 +65,8 @@ Examples of GOOD responses:
 Return a JSON object with port names as exact keys matching the input list.
 """
 
+register_model_config("ports", GENERATION_CONFIG, SYSTEM_PROMPT)
+
 
 
 def generate_port_summaries() -> dict[str, str]:
@@ -82,32 +88,19 @@ def generate_port_summaries() -> dict[str, str]:
         logger.warning("GEMINI_API_KEY not set. Using fallback summaries.")
         return _get_fallback_summaries()
     
-    # Build port list
-    port_names = [name for name, _, _, _, _ in MAJOR_PORTS]
-    
-    logger.info("Generating AI summaries for %d ports...", len(port_names))
+    logger.info("Generating AI summaries for %d ports...", len(_PORT_NAMES))
     
     try:
-        model = genai.GenerativeModel(
-            model_name="gemini-3-flash-preview",
-            generation_config=GENERATION_CONFIG,
-            system_instruction=SYSTEM_PROMPT
-        )
+        model = get_model(MODEL_NAME, "ports", "ports")
         
-        prompt = f"""Analyze the current supply chain status for these major shipping ports:
-
-{chr(10).join(f"- {name}" for name in port_names)}
-
-Provide a status summary for each port."""
-
-        response = model.generate_content(prompt)
-        summaries = json.loads(response.text)
+        response = model.generate_content(_PORT_PROMPT)
+        summaries = json_loads(response.text)
         
         # Cache the result
         set_cached(CACHE_KEY, {
             "summaries": summaries,
             "_updated": datetime.now().strftime("%Y-%m-%d %H:%M")
-        })
+        }, compress=True)
         
         logger.info("Successfully generated and cached %d port summaries", len(summaries))
         return summaries
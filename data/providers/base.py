@@ -33,6 +33,13 @@ class BaseProvider(ABC):
     # Override in subclass — must match a key in config.CATEGORY_WEIGHTS
     category: str = ""
 
+    # Precomputed per subclass in __init_subclass__
+    _repr_name: str = ""
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._repr_name = f"<{cls.__name__} category={cls.category!r}>"
+
     @abstractmethod
     def fetch_current(self) -> tuple[float, dict]:
         """Return the current category score and metadata.
@@ -61,4 +68,4 @@ class BaseProvider(ABC):
         """
 
     def __repr__(self) -> str:
-        return f"<{type(self).__name__} category={self.category!r}>"
+        return self._repr_name
@@ -34,14 +34,45 @@ Source: Yahoo Finance (HG=F)
 
 from __future__ import annotations
 
+import logging
+
 import numpy as np
 import pandas as pd
-import yfinance as yf
 from datetime import datetime
 
 from config import HISTORY_DAYS
 from data.providers.base import BaseProvider
 from data.providers.fred_client import fetch_fred_series
+from data.providers.yf_client import fetch_yf_history
+
+logger = logging.getLogger(__name__)
+
+
+def _normalize_around_median(series: pd.Series) -> pd.Series:
+    """Score each point by its distance from the series median.
+
+    The median maps to 100 and the largest absolute deviation maps to 0.
+    Computed in a single NumPy pass; the max deviation is taken from the
+    deviation array itself rather than separate min/max reductions. NaNs
+    are skipped by the median and max (as pandas does) and stay NaN.
+
+    Parameters
+    ----------
+    series : pd.Series
+        Raw FRED data.
+
+    Returns
+    -------
+    pd.Series
+        Scores in [0, 100], same index as input.
+    """
+    vals = series.to_numpy(dtype=float)
+    dev = np.abs(vals - np.nanmedian(vals))
+    max_dev = np.nanmax(dev)
+    if max_dev == 0:
+        return pd.Series(100.0, index=series.index)
+    scores = np.clip((1 - dev / max_dev) * 100, 0, 100)
+    return pd.Series(scores, index=series.index)
 
 
 class DemandProvider(BaseProvider):
@@ -62,33 +93,36 @@ class DemandProvider(BaseProvider):
         # -------------------------------------------------------------------
         
         try:
-            ticker = yf.Ticker("HG=F")
-            
             # --- 1. Fetch Price & History ---
             # We need history for both Range (5y) and Volatility (30d)
-            hist = ticker.history(period="5y")
+            hist = fetch_yf_history("HG=F", period="5y")
             
             if hist.empty:
                 raise ValueError("No copper data available")
                 
-            current_price = float(hist["Close"].iloc[-1])
-            prev_close = float(hist["Close"].iloc[-2])
+            close = hist["Close"].to_numpy(dtype=float)
+            current_price = float(close[-1])
+            prev_close = float(close[-2])
             
             # --- 2. Calculate Volatility (30-day Annualized) ---
-            # Log returns
-            hist["Log_Ret"] = np.log(hist["Close"] / hist["Close"].shift(1))
-            # 30-day rolling std dev, annualized (assuming 252 trading days)
-            vol_30d = hist["Log_Ret"].tail(30).std() * np.sqrt(252) * 100
+            # Log returns over the last 30 sessions only (31 closes)
+            tail = close[-31:]
+            log_ret = np.log(tail[1:] / tail[:-1])
+            # 30-day std dev, annualized (assuming 252 trading days)
+            vol_30d = float(np.nanstd(log_ret, ddof=1) * np.sqrt(252) * 100)
             
             # --- 3. Normalization Factors ---
             
             # A. Price Factor (Range-based)
             # Min/Max from last 5 years
-            min_price = float(hist["Close"].min())
+            min_price = float(np.nanmin(close))
             # Add 50% buffer to max to allow for "high but not crisis" scoring
-            max_price = float(hist["Close"].max()) * 1.50
+            max_price = float(np.nanmax(close)) * 1.50
             
-            print(f"DEBUG: Demand - Price {current_price:.2f} | Range {min_price:.2f}-{max_price:.2f} | Vol {vol_30d:.1f}%")
+            logger.debug(
+                "Demand - Price %.2f | Range %.2f-%.2f | Vol %.1f%%",
+                current_price, min_price, max_price, vol_30d,
+            )
 
             # Normalize Current Price (0.0 to 1.0)
             if max_price > min_price:
@@ -136,7 +170,7 @@ class DemandProvider(BaseProvider):
             }
             
         except Exception as e:
-            print(f"Demand Index Error: {e}")
+            logger.exception("Demand Index Error: %s", e)
             return 50.0, {
                 "source": "System Error",
                 "description": "Live copper data unavailable.",
@@ -156,10 +190,7 @@ class DemandProvider(BaseProvider):
         
         raw = fetch_fred_series(self._SERIES_ID)
         # Normalize: Median = 100. Deviation = lower score.
-        median = raw.median()
-        deviation = (raw - median).abs()
-        max_dev = deviation.max()
-        scores = ((1 - (deviation / max_dev)) * 100).clip(0, 100)
+        scores = _normalize_around_median(raw)
         
         daily = scores.resample("D").ffill()
         return daily.tail(days).rename("demand")
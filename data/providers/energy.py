@@ -16,6 +16,10 @@ from __future__ import annotations
 
 
 from datetime import datetime
+import logging
+import threading
+import time
+
 import pandas as pd
 
 from config import HISTORY_DAYS
@@ -23,8 +27,49 @@ from data.providers.base import BaseProvider
 from data.providers.fred_client import (
     fetch_fred_series,
     normalize_series_inverse,
+    score_against_history,
 )
 
+logger = logging.getLogger(__name__)
+
+_TICKER_SYMBOL = "CL=F"
+
+# Live quotes are shared by every caller within a short window (one
+# dashboard refresh asks several times) instead of each hitting Yahoo.
+_QUOTE_TTL_SECONDS = 60
+_QUOTE_LOCK = threading.Lock()
+_quote: tuple[float, float, float | None] | None = None  # (fetched_at, price, prev_close)
+_ticker = None
+
+
+def _fetch_live_quote() -> tuple[float, float | None]:
+    """Return ``(price, previous_close)`` for WTI futures, cached for 60s.
+
+    Both values are read from a single ``fast_info`` snapshot of a
+    module-level ``yf.Ticker``, so the symbol is only resolved once per
+    process.
+    """
+    global _quote, _ticker
+    with _QUOTE_LOCK:
+        if _quote is not None and time.monotonic() - _quote[0] < _QUOTE_TTL_SECONDS:
+            return _quote[1], _quote[2]
+
+        if _ticker is None:
+            import yfinance as yf
+            _ticker = yf.Ticker(_TICKER_SYMBOL)
+
+        info = _ticker.fast_info
+        # Try to get the absolute latest real-time price
+        price = info["last_price"]
+        if not price:
+            # Fallback to recent history if market is closed/fast_info empty
+            hist = _ticker.history(period="1d")
+            price = float(hist["Close"].iloc[-1])
+        prev_close = info["previous_close"]
+
+        _quote = (time.monotonic(), price, prev_close)
+        return price, prev_close
+
 
 class EnergyProvider(BaseProvider):
     """Energy & Fuel — derived from WTI crude oil price."""
@@ -33,20 +78,11 @@ class EnergyProvider(BaseProvider):
     _SERIES_ID = "DCOILWTICO"
 
     def fetch_current(self) -> tuple[float, dict]:
-        import yfinance as yf
-        
         # 1. Fetch Live Data from Yahoo Finance
-        ticker = yf.Ticker("CL=F")
         try:
-            # Try to get the absolute latest real-time price
-            price = ticker.fast_info.get("last_price")
-            if not price:
-                # Fallback to recent history if market is closed/fast_info empty
-                hist = ticker.history(period="1d")
-                price = float(hist["Close"].iloc[-1])
-            
+            price, prev_close = _fetch_live_quote()
+
             # Get previous close for "Change" calculation
-            prev_close = ticker.fast_info.get("previous_close")
             change_str = ""
             if prev_close:
                 pct_change = ((price - prev_close) / prev_close) * 100
@@ -54,21 +90,16 @@ class EnergyProvider(BaseProvider):
 
         except Exception as e:
             # Fallback to FRED if Yahoo fails
-            print(f"[EnergyProvider] yfinance failed: {e}, falling back to FRED.")
+            logger.warning("yfinance failed: %s, falling back to FRED.", e)
             raw = fetch_fred_series(self._SERIES_ID)
             price = float(raw.iloc[-1])
             change_str = ""
 
         # 2. Normalize against FRED History (to keep baseline consistent)
-        # We still use the FRED 5-year history to define what is "High" vs "Low"
-        fred_hist = fetch_fred_series(self._SERIES_ID)
-        min_val = fred_hist.min()
-        max_val = fred_hist.max()
-        
-        # Inverse Normalization: Lower Price = Higher Score
-        # 100 at min, 0 at max
-        norm_score = 100 * (1 - (price - min_val) / (max_val - min_val))
-        score = max(0.0, min(100.0, norm_score))
+        # We still use the FRED 5-year history to define what is "High" vs "Low";
+        # only its cached range is needed, not the full series.
+        # Inverse Normalization: Lower Price = Higher Score (100 at min, 0 at max)
+        score = score_against_history(self._SERIES_ID, price, inverse=True)
 
         return score, {
             "source": "Live Futures (CL=F)",
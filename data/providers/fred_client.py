@@ -19,15 +19,23 @@ import logging
 import os
 from datetime import datetime, timedelta
 
+import numpy as np
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
 
-from data.cache import get_cached, set_cached
+from data.cache import get_cached, get_cached_arrow, json_loads, set_cached, set_cached_arrow
 
 logger = logging.getLogger(__name__)
 
 _BASE_URL = "https://api.stlouisfed.org/fred/series/observations"
 
+# One pooled session for every FRED call, so the providers' concurrent
+# fetches reuse warm keep-alive connections instead of a new TLS handshake
+# each. requests already sends gzip Accept-Encoding and keep-alive headers.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=10))
+
 
 def _get_api_key() -> str:
     """Read the FRED API key from environment, or raise a clear error."""
@@ -72,19 +80,18 @@ def fetch_fred_series(
         If the FRED API returns a non-200 status code.
     """
     cache_key = f"fred_{series_id}"
-    cached = get_cached(cache_key, ttl=cache_ttl)
+    cached = get_cached_arrow(cache_key, ttl=cache_ttl)
     if cached is not None:
-        # Rebuild Series from cached dict
-        s = pd.Series(cached["values"], name=series_id)
-        s.index = pd.DatetimeIndex(cached["dates"])
-        return s
+        # Arrow keeps the DatetimeIndex as int64, so no date-string parsing;
+        # repeat hits in the same process come straight from the cache memo.
+        return cached
 
     api_key = _get_api_key()
     start_date = (datetime.now() - timedelta(days=lookback_days)).strftime("%Y-%m-%d")
 
     logger.info("Fetching FRED series %s (from %s)", series_id, start_date)
 
-    resp = requests.get(
+    resp = _SESSION.get(
         _BASE_URL,
         params={
             "series_id": series_id,
@@ -97,25 +104,102 @@ def fetch_fred_series(
     )
     resp.raise_for_status()
 
-    observations = resp.json().get("observations", [])
+    observations = json_loads(resp.content).get("observations", [])
 
-    dates: list[str] = []
-    values: list[float] = []
-    for obs in observations:
-        # FRED uses "." for missing values — skip them
-        if obs["value"] == ".":
-            continue
-        dates.append(obs["date"])
-        values.append(float(obs["value"]))
+    # FRED uses "." for missing values — skip them. NumPy converts the
+    # remaining value/date strings in C rather than one float() per row.
+    valid = [obs for obs in observations if obs["value"] != "."]
+    values = np.array([obs["value"] for obs in valid], dtype=np.float64)
+    dates = np.array([obs["date"] for obs in valid], dtype="datetime64[D]")
 
-    series = pd.Series(values, index=pd.DatetimeIndex(dates), name=series_id)
+    series = pd.Series(values, index=pd.DatetimeIndex(dates.astype("datetime64[ns]")), name=series_id)
 
-    # Cache the result
-    set_cached(cache_key, {"dates": dates, "values": values})
+    # Cache the result, plus the range stats providers normalize against
+    set_cached_arrow(cache_key, series)
+    _set_cached_stats(series_id, series)
 
     return series
 
 
+def _set_cached_stats(series_id: str, series: pd.Series) -> None:
+    """Store the range stats of ``series`` under ``fred_stats_{series_id}``."""
+    if series.empty:
+        return
+    set_cached(f"fred_stats_{series_id}", {
+        "min": float(series.min()),
+        "max": float(series.max()),
+        "last_date": str(series.index[-1].date()),
+    })
+
+
+def fetch_fred_stats(
+    series_id: str,
+    lookback_days: int = 365 * 5,
+    cache_ttl: int = 86400,
+) -> tuple[float, float]:
+    """Return the ``(min, max)`` of a FRED series without rebuilding it.
+
+    A 5-year range barely moves day to day, so the stats entry lives far
+    longer than the observations themselves (24 h vs 1 h). It is rewritten
+    whenever the series is refetched, and on a stats miss it is rebuilt
+    from :func:`fetch_fred_series` (which may itself be a cache hit).
+
+    Parameters
+    ----------
+    series_id : str
+        FRED series identifier.
+    lookback_days : int
+        Passed through to :func:`fetch_fred_series` on a miss.
+    cache_ttl : int
+        Lifetime of the stats entry in seconds. Default 24 hours.
+
+    Returns
+    -------
+    tuple[float, float]
+        Historical minimum and maximum over the cached window.
+    """
+    cached = get_cached(f"fred_stats_{series_id}", ttl=cache_ttl)
+    if cached is not None and cached.get("min") is not None:
+        return float(cached["min"]), float(cached["max"])
+
+    series = fetch_fred_series(series_id, lookback_days=lookback_days)
+    _set_cached_stats(series_id, series)
+    return float(series.min()), float(series.max())
+
+
+def score_against_history(
+    series_id: str,
+    live_value: float,
+    inverse: bool = True,
+) -> float:
+    """Score a live reading against the 5-year range of a FRED series.
+
+    Only the cached ``(min, max)`` from :func:`fetch_fred_stats` is read,
+    so a live provider's hot path does no pandas work at all.
+
+    Parameters
+    ----------
+    series_id : str
+        FRED series that defines the historical range.
+    live_value : float
+        Current reading, in the same units as the series.
+    inverse : bool
+        If True (default), the historical min scores 100 and the max 0;
+        otherwise the mapping is direct.
+
+    Returns
+    -------
+    float
+        Score clipped to [0, 100]; 50 if the range is degenerate.
+    """
+    min_val, max_val = fetch_fred_stats(series_id)
+    if max_val == min_val:
+        return 50.0
+    frac = (live_value - min_val) / (max_val - min_val)
+    score = 100.0 * (1.0 - frac) if inverse else 100.0 * frac
+    return max(0.0, min(100.0, score))
+
+
 def normalize_series_inverse(series: pd.Series) -> pd.Series:
     """Normalize a series where LOWER raw values = HIGHER health score.
 
@@ -134,11 +218,17 @@ def normalize_series_inverse(series: pd.Series) -> pd.Series:
     pd.Series
         Scores in [0, 100], same index as input.
     """
-    min_val = series.min()
-    max_val = series.max()
+    arr = series.to_numpy(dtype=np.float64)
+    min_val = np.nanmin(arr)
+    max_val = np.nanmax(arr)
     if max_val == min_val:
         return pd.Series(50.0, index=series.index)
-    return ((1 - (series - min_val) / (max_val - min_val)) * 100).round(1)
+    # 100 * (1 - (x - min) / span), computed in one output buffer
+    out = np.subtract(arr, min_val)
+    out *= -100.0 / (max_val - min_val)
+    out += 100.0
+    np.round(out, 1, out=out)
+    return pd.Series(out, index=series.index, name=series.name)
 
 
 def normalize_series_direct(series: pd.Series) -> pd.Series:
@@ -159,8 +249,13 @@ def normalize_series_direct(series: pd.Series) -> pd.Series:
     pd.Series
         Scores in [0, 100], same index as input.
     """
-    min_val = series.min()
-    max_val = series.max()
+    arr = series.to_numpy(dtype=np.float64)
+    min_val = np.nanmin(arr)
+    max_val = np.nanmax(arr)
     if max_val == min_val:
         return pd.Series(50.0, index=series.index)
-    return (((series - min_val) / (max_val - min_val)) * 100).round(1)
+    # 100 * (x - min) / span, computed in one output buffer
+    out = np.subtract(arr, min_val)
+    out *= 100.0 / (max_val - min_val)
+    np.round(out, 1, out=out)
+    return pd.Series(out, index=series.index, name=series.name)
@@ -24,46 +24,88 @@ supply chain news — a score of 100 would mean "no news at all" which
 isn't realistic or useful.
 """
 
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+import functools
 import logging
+import math
+from operator import itemgetter
 import os
+import re
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import numpy as np
 import pandas as pd
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 
-from data.cache import get_cached, set_cached
+from data.cache import get_cached_swr, json_loads, set_cached
 from data.providers.base import BaseProvider
-from data.ai_analyst import analyze_news_batch
+from data.ai_analyst import run_all_ai
 
 # ...
 
 logger = logging.getLogger(__name__)
 
 _NEWSAPI_URL = "https://newsapi.org/v2/everything"
-_VADER = SentimentIntensityAnalyzer()
+
+# High-frequency off-topic terms are excluded server-side so they are never
+# downloaded or parsed; the local irrelevance screen still catches the rest.
+# NewsAPI caps ``q`` at 500 characters (this one is ~280).
+_NEWSAPI_EXCLUDE = (
+    "free shipping", "promo code", "fantasy", "cryptocurrency", "horoscope",
+    "lottery", "skincare", "cagr", "recipe",
+)
+_NEWSAPI_Q = (
+    '("supply chain" OR "freight" OR "shipping") AND '
+    '(port OR logistics OR cargo OR trade OR tariff OR canal OR strait OR "red sea" OR container) '
+    'AND NOT ("' + '" OR "'.join(_NEWSAPI_EXCLUDE) + '")'
+)
+
+# Pooled keep-alive session for NewsAPI requests; transient 5xx responses
+# are retried on the same connection with a short backoff. 429 is not
+# retried: a throttled key would only burn more of its daily quota.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=10,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(502, 503)),
+))
+
+
+@functools.cache
+def _vader() -> SentimentIntensityAnalyzer:
+    """VADER analyzer, built on first use.
+
+    Loading its ~7.5k-term lexicon takes a noticeable slice of import time
+    and is only needed when the AI analysis fails, so defer it until then.
+    """
+    return SentimentIntensityAnalyzer()
+
 
 # ---------------------------------------------------------------------------
 # Category classification keywords
 # When an article matches multiple categories, the FIRST match wins
 # (ordered by specificity — most specific categories first).
 # ---------------------------------------------------------------------------
-_CATEGORY_KEYWORDS: dict[str, set[str]] = {
-    "weather":      {"hurricane", "typhoon", "storm", "flood", "drought", "cyclone", "tornado", "wildfire", "earthquake"},
-    "ports":        {"port", "congestion", "container terminal", "vessel queue", "berth", "dock worker", "longshoreman", "dwell time"},
-    "energy":       {"oil", "crude", "gas price", "fuel", "opec", "petroleum", "brent", "lng", "refinery", "pipeline", "energy cost"},
-    "tariffs":      {"tariff", "trade war", "duty", "import ban", "export ban", "sanctions", "trade deal", "cbam", "trade policy", "customs"},
-    "shipping":     {"freight rate", "container rate", "shipping cost", "blank sailing", "feu", "teu", "carrier", "maersk", "hapag", "cosco"},
-    "demand":       {"inventory", "shortage", "surplus", "consumer demand", "retail sales", "stockpile", "backlog", "pmi"},
-    "geopolitical": {"war", "conflict", "missile", "blockade", "military", "coup", "protest", "unrest", "territory", "houthi", "red sea"},
-    "chokepoint":   {"suez canal", "panama canal", "malacca strait", "strait of hormuz", "bab el-mandeb", "bosporus", "dardanelles", "cape of good hope"},
+_CATEGORY_KEYWORDS: dict[str, frozenset[str]] = {
+    "weather":      frozenset({"hurricane", "typhoon", "storm", "flood", "drought", "cyclone", "tornado", "wildfire", "earthquake"}),
+    "ports":        frozenset({"port", "congestion", "container terminal", "vessel queue", "berth", "dock worker", "longshoreman", "dwell time"}),
+    "energy":       frozenset({"oil", "crude", "gas price", "fuel", "opec", "petroleum", "brent", "lng", "refinery", "pipeline", "energy cost"}),
+    "tariffs":      frozenset({"tariff", "trade war", "duty", "import ban", "export ban", "sanctions", "trade deal", "cbam", "trade policy", "customs"}),
+    "shipping":     frozenset({"freight rate", "container rate", "shipping cost", "blank sailing", "feu", "teu", "carrier", "maersk", "hapag", "cosco"}),
+    "demand":       frozenset({"inventory", "shortage", "surplus", "consumer demand", "retail sales", "stockpile", "backlog", "pmi"}),
+    "geopolitical": frozenset({"war", "conflict", "missile", "blockade", "military", "coup", "protest", "unrest", "territory", "houthi", "red sea"}),
+    "chokepoint":   frozenset({"suez canal", "panama canal", "malacca strait", "strait of hormuz", "bab el-mandeb", "bosporus", "dardanelles", "cape of good hope"}),
 }
 
 
 # Terms that indicate an article is clearly NOT about supply chains.
 # If any of these appear in the title or body, the article is skipped
 # before it ever matches to a port.  Keeps garbage out of scores.
-_IRRELEVANT_TERMS: set[str] = {
+_IRRELEVANT_TERMS: frozenset[str] = frozenset({
     "fantasy", "baseball", "football", "basketball", "hockey", "nfl",
     "nba", "nhl", "mlb", "premier league", "world cup", "olympics",
     "vacation", "resort", "airbnb", "tourism", "travel deal",
@@ -95,12 +137,41 @@ _IRRELEVANT_TERMS: set[str] = {
     # Generic Market Research Spam
     "market size", "market share", "market growth", "market forecast", 
     "market analysis", "growth analysis", "forecast 20", "cagr",
-}
+})
+
+
+def _trie_pattern(words) -> str:
+    """Build a regex matching any of ``words``, factored as a prefix trie.
+
+    A flat ``a|b|c`` alternation makes the regex engine retry every
+    branch at every position (slower than plain ``in`` checks); sharing
+    prefixes lets it reject most positions after a character or two.
+    """
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node: dict) -> str:
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+# All irrelevant terms in one pattern: a single C-level scan per article
+# instead of ~100 separate substring searches.
+_IRRELEVANT_PATTERN = re.compile(_trie_pattern(_IRRELEVANT_TERMS))
 
 
 def _is_irrelevant_article(text: str) -> bool:
     """Return True if the article text contains clearly off-topic terms."""
-    return any(term in text for term in _IRRELEVANT_TERMS)
+    return _IRRELEVANT_PATTERN.search(text) is not None
 
 
 def _get_api_key() -> str:
@@ -122,6 +193,71 @@ def _classify_category_keyword(text: str) -> str:
     return "geopolitical"
 
 
+def _search_text(title: str | None, description: str | None) -> str:
+    """Lowercased ``title + description``, built once per candidate."""
+    return f"{title or ''} {description or ''}".lower()
+
+
+def _fetch_newsapi_articles(cache_ttl: int = 1800) -> list[dict]:
+    """Fetch raw NewsAPI articles for the RSS-outage fallback.
+
+    The parsed article list is kept in the disk cache, so restarting the
+    app during an RSS outage doesn't spend another NewsAPI request. The
+    response ``ETag`` is stored with it: once the entry expires, the
+    refetch is conditional, and a ``304 Not Modified`` just renews the
+    cached copy without downloading or parsing the payload again.
+
+    Parameters
+    ----------
+    cache_ttl : int
+        Cache lifetime in seconds. Default 30 minutes.
+
+    Returns
+    -------
+    list[dict]
+        NewsAPI ``articles`` payload. On failure, the expired cached copy
+        (up to a day old) if there is one, otherwise an empty list.
+    """
+    cache_key = "newsapi_articles_v2"
+    # Expired entries stay usable for a day as the If-None-Match baseline
+    cached, is_stale = get_cached_swr(cache_key, fresh_ttl=cache_ttl, stale_ttl=86400)
+    if cached is not None and not is_stale:
+        return cached["articles"]
+
+    headers = {}
+    if cached is not None and cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+
+    from_date = (datetime.utcnow() - timedelta(days=3)).strftime("%Y-%m-%d")
+    try:
+        resp = _SESSION.get(
+            _NEWSAPI_URL,
+            params={
+               "q": _NEWSAPI_Q,
+               "from": from_date,
+               "sortBy": "publishedAt",
+               "language": "en",
+               "apiKey": _get_api_key(),
+            },
+            headers=headers,
+            timeout=10
+        )
+        if resp.status_code == 304 and cached is not None:
+            logger.info("NewsAPI results unchanged (304); renewing cached copy")
+            set_cached(cache_key, cached)
+            return cached["articles"]
+        resp.raise_for_status()
+        articles = json_loads(resp.content).get("articles", [])
+    except Exception as e:
+        logger.error("NewsAPI Fallback failed: %s", e)
+        # A stale copy still beats no articles at all
+        return cached["articles"] if cached is not None else []
+
+    if articles:
+        set_cached(cache_key, {"etag": resp.headers.get("ETag"), "articles": articles})
+    return articles
+
+
 def _score_to_severity(score: float) -> str:
     """Map severity score to label."""
     if score <= -4: return "high"
@@ -129,19 +265,64 @@ def _score_to_severity(score: float) -> str:
     return "low"
 
 
+_NEWS_CACHE_KEY = "newsapi_briefing_v14"
+_NEWS_FRESH_TTL = 14400   # 4-hour cache (reduced API usage)
+_NEWS_STALE_TTL = 86400   # older briefings are still served while refreshing
+
+# Background refreshes run one at a time; the flag stops every caller that
+# sees a stale entry from queueing its own duplicate refresh.
+_REFRESH_EXECUTOR = ThreadPoolExecutor(max_workers=1)
+_REFRESH_LOCK = threading.Lock()
+_refresh_pending = False
+
+
 def fetch_supply_chain_news() -> tuple[float, list[dict], str, str]:
     """Fetch news and analyze using AI (Gemini) with VADER fallback.
-    
+
+    Stale-while-revalidate: once the cached briefing is older than 4 hours
+    (but under 24) it is returned immediately and rebuilt in the
+    background, so the slow RSS + Gemini round trip never sits on the
+    request path. Only a cold or day-old cache is refreshed inline.
+
     Returns
     -------
     tuple
         (score, alerts, briefing_text, full_report_md)
     """
-    cache_key = "newsapi_briefing_v14"
-    cached = get_cached(cache_key, ttl=14400)  # 4-hour cache (reduced API usage)
-    if cached is not None:
-        return cached["score"], cached["alerts"], cached.get("briefing", ""), cached.get("full_report", "")
+    cached, is_stale = get_cached_swr(
+        _NEWS_CACHE_KEY, fresh_ttl=_NEWS_FRESH_TTL, stale_ttl=_NEWS_STALE_TTL
+    )
+    if cached is None:
+        cached = _refresh_supply_chain_news()
+    elif is_stale:
+        _schedule_news_refresh()
+    return cached["score"], cached["alerts"], cached.get("briefing", ""), cached.get("full_report", "")
+
+
+def _schedule_news_refresh() -> None:
+    """Rebuild the news briefing in the background (at most one at a time)."""
+    global _refresh_pending
+    with _REFRESH_LOCK:
+        if _refresh_pending:
+            return
+        _refresh_pending = True
+
+    def _run() -> None:
+        global _refresh_pending
+        try:
+            _refresh_supply_chain_news()
+        except Exception:
+            logger.exception("Background news refresh failed")
+        finally:
+            with _REFRESH_LOCK:
+                _refresh_pending = False
+
+    logger.info("News briefing is stale; refreshing in the background")
+    _REFRESH_EXECUTOR.submit(_run)
 
+
+def _refresh_supply_chain_news() -> dict:
+    """Fetch, analyze and cache the news briefing; returns the cached dict."""
     # 1. Fetch from RSS Feeds (High Quality, User Specified)
     from data.rss_fetcher import fetch_rss_articles
     
@@ -151,67 +332,52 @@ def fetch_supply_chain_news() -> tuple[float, list[dict], str, str]:
     # but the user requested "make sure gemini does it based on these", so we prioritize RSS heavily.
     # If RSS returns < 5 items, we might fall back, but let's stick to RSS for now to ensure quality.
     
-    candidates = []
-    
-    # 2. Convert RSS to standard format
-    for i, art in enumerate(rss_articles):
-        # Clean description for AI
-        desc = art["description"]
-        # Basic cleanup of HTML if any remains (though feedparser does some)
-        
-        candidates.append({
+    # 2. Convert RSS to standard format (one comprehension, no per-item appends)
+    candidates = [
+        {
             "id": i,
             "title": art["title"],
-            "description": desc,
+            "description": art["description"],
             "url": art["url"],
             "source": art["source"],
-            "published": art["published"]
-        })
+            "published": art["published"],
+            "_searchtext": _search_text(art["title"], art["description"]),
+        }
+        for i, art in enumerate(rss_articles)
+    ]
 
     # If absolutely no RSS data, fallback to NewsAPI (Safety Net)
     if not candidates:
         logger.warning("No RSS articles found! Falling back to NewsAPI.")
-        # ... (NewsAPI Logic hidden here if we wanted, or just call the old logic?)
-        # For now, let's keep the old NewsAPI logic as a fallback block.
-        api_key = _get_api_key()
-        try:
-            resp = requests.get(
-                _NEWSAPI_URL,
-                params={
-                   "q": '("supply chain" OR "freight") AND (port OR container)',
-                   "from": from_date,
-                   "sortBy": "publishedAt",
-                   "language": "en",
-                   "apiKey": api_key,
-                },
-                timeout=10
-            )
-            if resp.status_code == 200:
-                news_arts = resp.json().get("articles", [])
-                for i, art in enumerate(news_arts):
-                    candidates.append({
-                        "id": i + 1000, # Offset IDs
-                        "title": art.get("title"),
-                        "description": art.get("description"),
-                        "url": art.get("url"),
-                        "source": art.get("source", {}).get("name"),
-                        "published": art.get("publishedAt")
-                    })
-        except Exception as e:
-            logger.error(f"NewsAPI Fallback failed: {e}")
+        candidates = [
+            {
+                "id": i + 1000, # Offset IDs
+                "title": art.get("title"),
+                "description": art.get("description"),
+                "url": art.get("url"),
+                "source": (art.get("source") or {}).get("name"),
+                "published": art.get("publishedAt"),
+                "_searchtext": _search_text(art.get("title"), art.get("description")),
+            }
+            for i, art in enumerate(_fetch_newsapi_articles())
+        ]
+
+    # Drop clearly off-topic items up front so they never cost LLM tokens
+    # (they would only be discarded after analysis anyway).
+    relevant = [c for c in candidates if not _is_irrelevant_article(c["_searchtext"])]
+    if len(relevant) < len(candidates):
+        logger.info("Filtered %d off-topic articles before AI analysis", len(candidates) - len(relevant))
+    candidates = relevant
 
     # Limit to top 20 for AI analysis (RSS quality is higher, so we can process more)
     ai_candidates = candidates[:20]
     
-    # 3. Analyze with Gemini
-    ai_results, ai_briefing = analyze_news_batch(ai_candidates)
-    
-    # Generate Full Report (New Feature)
-    # We use the full set of RSS candidates (or top 50) for a broader context
-    from data.ai_analyst import generate_full_report
-    full_report_md = generate_full_report(candidates[:50])
+    # 3. Analyze with Gemini + Generate Full Report (concurrently)
+    # We use the full set of RSS candidates (or top 50) for a broader report context
+    ai_results, ai_briefing, full_report_md = run_all_ai(ai_candidates, candidates[:50])
     
     alerts = []
+    severities: list[float] = []
     severity_sum = 0.0
     briefing_text = ai_briefing
     
@@ -219,15 +385,16 @@ def fetch_supply_chain_news() -> tuple[float, list[dict], str, str]:
     
     if ai_results:
         logger.info(f"AI successfully analyzed {len(ai_results)} articles")
+        by_id = {c["id"]: c for c in ai_candidates}
         for cid, analysis in ai_results.items():
             if not analysis.get("is_relevant", False):
                 continue
                 
             severity = analysis.get("severity_score", 0.0)
-            severity_sum += severity
+            severities.append(severity)
             
             # Find original
-            original = next((c for c in ai_candidates if c["id"] == cid), None)
+            original = by_id.get(cid)
             if not original:
                 continue
                 
@@ -241,6 +408,7 @@ def fetch_supply_chain_news() -> tuple[float, list[dict], str, str]:
                 "url": original["url"],
                 "source": original["source"],
             })
+        severity_sum = math.fsum(severities)
     
     # Fallback VADER for non-AI analyzed items or if AI failed
     if not alerts and candidates:
@@ -251,7 +419,8 @@ def fetch_supply_chain_news() -> tuple[float, list[dict], str, str]:
     final_score = 100.0 + severity_sum
     final_score = max(0.0, min(100.0, final_score))
 
-    alerts.sort(key=lambda a: (a["sentiment"], a["timestamp"]), reverse=False)
+    # Most severe first; itemgetter builds the key tuple in C.
+    alerts.sort(key=itemgetter("sentiment", "timestamp"))
 
     result = {
         "score": round(final_score, 1),
@@ -260,8 +429,8 @@ def fetch_supply_chain_news() -> tuple[float, list[dict], str, str]:
         "full_report": full_report_md
     }
     
-    set_cached(cache_key, result)
-    return result["score"], result["alerts"], result["briefing"], result["full_report"]
+    set_cached(_NEWS_CACHE_KEY, result)
+    return result
 
 
 class GeopoliticalProvider(BaseProvider):
@@ -273,8 +442,8 @@ class GeopoliticalProvider(BaseProvider):
         score, alerts, _, _ = fetch_supply_chain_news()
         
         # Calculate recent negative news count
-        high_sev = sum(1 for a in alerts if a['severity'] == 'high')
-        med_sev = sum(1 for a in alerts if a['severity'] == 'medium')
+        severity_counts = Counter(a["severity"] for a in alerts)
+        high_sev, med_sev = severity_counts["high"], severity_counts["medium"]
         
         return score, {
             "source": "NewsAPI + VADER Sentiment",
@@ -303,18 +472,20 @@ class GeopoliticalProvider(BaseProvider):
         """
         from data.providers.fred_client import fetch_fred_series
         
-        # 1. Get current score (anchor point)
-        # Handle tuple return from fetch_current
-        current_result = self.fetch_current()
-        if isinstance(current_result, tuple):
-            current_score = current_result[0]
-        else:
-            current_score = current_result
-
-        try:
+        # The VIX download and the news anchor are independent network
+        # calls, so run them side by side (wall time = the slower of the two).
+        with ThreadPoolExecutor(max_workers=1) as pool:
             # We fetch a bit more history than needed to ensure we have enough data points
             # after dropping NaNs and alignment.
-            vix = fetch_fred_series("VIXCLS", lookback_days=days + 60)
+            vix_future = pool.submit(fetch_fred_series, "VIXCLS", lookback_days=days + 60)
+
+            # 1. Get current score (anchor point)
+            # Only the scalar is needed, so read it straight from the (cached)
+            # news fetch instead of building fetch_current()'s metadata.
+            current_score = fetch_supply_chain_news()[0]
+
+        try:
+            vix = vix_future.result()
             
             # 2. Normalize (Inverted: Low VIX is good)
             # We use a fixed "reasonable" range for VIX normalization to keep it consistent
@@ -327,29 +498,39 @@ class GeopoliticalProvider(BaseProvider):
             #   10 -> 100
             #   35 -> 50
             #   60 -> 0
-            vix_score = (120 - 2 * vix).clip(0, 100)
-            
+
             # 3. Align to current score
             # We want the shape of the VIX, but the level of our NewsAPI score.
-            if not vix_score.empty:
-                latest_vix = vix_score.iloc[-1]
-                delta = current_score - latest_vix
-                
+            # Done in place on one float buffer rather than chaining pandas
+            # arithmetic (each step would allocate a new Series).
+            if not vix.empty:
+                values = vix.to_numpy(dtype=float, copy=True)
+                values *= -2.0
+                values += 120.0
+                np.clip(values, 0, 100, out=values)
+
                 # Apply delta to the whole series
-                adjusted_score = (vix_score + delta).clip(0, 100)
-                
-                # Resample to daily (VIX is trading days only) and fill gaps
+                values += current_score - values[-1]
+                np.clip(values, 0, 100, out=values)
+
+                # Resample to daily (VIX is trading days only) and fill gaps:
+                # a forward fill is "last observation at or before each day",
+                # i.e. one searchsorted over the sorted int64 timestamps.
                 dates = pd.date_range(
                     end=datetime.now().replace(hour=0, minute=0, second=0, microsecond=0),
                     periods=days,
                     freq="D",
                 )
-                aligned = adjusted_score.reindex(dates, method="ffill")
-                
+                pos = np.searchsorted(
+                    vix.index.as_unit("ns").asi8, dates.as_unit("ns").asi8, side="right"
+                ) - 1
+                aligned = values[np.maximum(pos, 0)]
+                aligned[pos < 0] = np.nan  # days before the first observation
+
                 # Force the last point to be exactly our current score (integrity check)
-                aligned.iloc[-1] = current_score
-                
-                return aligned.rename("geopolitical")
+                aligned[-1] = current_score
+
+                return pd.Series(aligned, index=dates, name="geopolitical")
 
         except Exception as e:
             logger.warning("Failed to fetch VIX history: %s", e)
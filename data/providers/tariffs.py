@@ -23,6 +23,7 @@ from data.providers.base import BaseProvider
 from data.providers.fred_client import (
     fetch_fred_series,
     normalize_series_inverse,
+    score_against_history,
 )
 
 
@@ -34,9 +35,10 @@ class TariffsProvider(BaseProvider):
 
     def fetch_current(self) -> tuple[float, dict]:
         raw = fetch_fred_series(self._SERIES_ID)
-        scores = normalize_series_inverse(raw)
-        score = float(scores.iloc[-1])
         val = float(raw.iloc[-1])
+        # Only the latest point is needed here, so score it against the
+        # cached 5-year range instead of normalizing the whole series.
+        score = round(score_against_history(self._SERIES_ID, val, inverse=True), 1)
 
         return score, {
             "source": "FRED Series USEPUINDXD",
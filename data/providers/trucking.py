@@ -31,6 +31,7 @@ import pandas as pd
 from config import HISTORY_DAYS
 from data.providers.base import BaseProvider
 from data.providers.fred_client import fetch_fred_series
+from data.providers.yf_client import fetch_yf_history
 
 
 class TruckingProvider(BaseProvider):
@@ -47,10 +48,10 @@ class TruckingProvider(BaseProvider):
             info = ticker.fast_info
             live_ho_price = float(info.last_price) if info.last_price else float(info.previous_close)
             if live_ho_price is None or live_ho_price == 0:
-                 hist = ticker.history(period="5d")
+                 hist = fetch_yf_history(self._TICKER, period="5d")
                  live_ho_price = float(hist["Close"].iloc[-1])
         except Exception:
-             hist = ticker.history(period="5d")
+             hist = fetch_yf_history(self._TICKER, period="5d")
              live_ho_price = float(hist["Close"].iloc[-1])
 
         # 2. Fetch Baseline Retail Level (GASDESW)
@@ -150,8 +151,7 @@ class TruckingProvider(BaseProvider):
         # Let's use HO history + fixed recent spread to give the "daily wiggles"
         # that the user wants to see.
         
-        ticker = yf.Ticker(self._TICKER)
-        ho_hist = ticker.history(period="2y")["Close"]
+        ho_hist = fetch_yf_history(self._TICKER, period="2y")["Close"]
         
         # We need to approximate the spread over time.
         # Simplification: Use the current spread.
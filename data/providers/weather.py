@@ -36,7 +36,7 @@ import numpy as np
 import pandas as pd
 import requests
 
-from data.cache import get_cached, set_cached
+from data.cache import get_cached, get_cached_arrow, set_cached, set_cached_arrow
 from data.providers.base import BaseProvider
 
 logger = logging.getLogger(__name__)
@@ -427,14 +427,13 @@ class WeatherProvider(BaseProvider):
     def fetch_history(self, days: int) -> pd.Series:
         """Fetch historical weather from Open-Meteo, averaged across all hubs."""
         cache_key = f"weather_history_{days}"
-        cached = get_cached(cache_key, ttl=3600)
+        cached = get_cached_arrow(cache_key, ttl=3600)
         if cached is not None:
-            s = pd.Series(cached["values"], name="weather")
-            s.index = pd.DatetimeIndex(cached["dates"])
-            return s
+            return cached
 
-        end_date = (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
-        start_date = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
+        today = datetime.now()
+        end_date = (today - timedelta(days=1)).strftime("%Y-%m-%d")
+        start_date = (today - timedelta(days=days)).strftime("%Y-%m-%d")
 
         all_hub_series: list[pd.Series] = []
 
@@ -466,24 +465,31 @@ class WeatherProvider(BaseProvider):
                     for c, w, p, tmax, tmin
                     in zip(codes, winds, precips, t_maxes, t_mins)
                 ]
-                s = pd.Series(scores, index=pd.DatetimeIndex(dates))
+                # Open-Meteo dates are always "YYYY-MM-DD": parse them with
+                # NumPy directly instead of pandas' format inference.
+                index = pd.DatetimeIndex(np.array(dates, dtype="datetime64[D]").astype("datetime64[ns]"))
+                s = pd.Series(scores, index=index)
                 all_hub_series.append(s)
                 logger.info("Weather history for %s: %d days", name, len(scores))
             except Exception as exc:
                 logger.warning("Failed to fetch weather history for %s: %s", name, exc)
 
         if all_hub_series:
-            df = pd.concat(all_hub_series, axis=1)
-            avg_scores = df.mean(axis=1).round(1)
+            first_index = all_hub_series[0].index
+            if all(s.index.equals(first_index) for s in all_hub_series):
+                # Every hub shares the requested date range, so average the
+                # raw arrays directly instead of aligning a DataFrame.
+                matrix = np.stack([s.to_numpy(dtype=float) for s in all_hub_series])
+                avg_scores = pd.Series(np.nanmean(matrix, axis=0), index=first_index).round(1)
+            else:
+                df = pd.concat(all_hub_series, axis=1)
+                avg_scores = df.mean(axis=1).round(1)
         else:
             dates_idx = pd.date_range(start=start_date, end=end_date, freq="D")
             avg_scores = pd.Series(75.0, index=dates_idx)
 
         result = avg_scores.rename("weather")
 
-        set_cached(cache_key, {
-            "dates": [d.isoformat() for d in result.index],
-            "values": result.tolist(),
-        })
+        set_cached_arrow(cache_key, result)
 
         return result
@@ -0,0 +1,58 @@
+"""
+Yahoo Finance Client
+=====================
+Shared, cached wrapper around ``yf.Ticker(...).history(...)`` for providers
+that read futures prices from Yahoo Finance.
+
+Several providers ask for overlapping price history on every refresh (and
+each call is a blocking HTTPS round trip). Routing them through
+:func:`fetch_yf_history` turns repeat requests for the same
+``(ticker, period)`` into a local cache read.
+"""
+
+from __future__ import annotations
+
+import logging
+
+import pandas as pd
+import yfinance as yf
+
+from data.cache import get_cached_arrow, set_cached_arrow
+
+logger = logging.getLogger(__name__)
+
+
+def fetch_yf_history(
+    ticker: str,
+    period: str = "5y",
+    cache_ttl: int = 900,
+) -> pd.DataFrame:
+    """Fetch OHLCV history for a Yahoo Finance ticker, with caching.
+
+    Parameters
+    ----------
+    ticker : str
+        Yahoo Finance symbol (e.g., ``"HG=F"`` for copper futures).
+    period : str
+        History window accepted by ``yfinance`` (``"5d"``, ``"2y"``, ...).
+    cache_ttl : int
+        Cache lifetime in seconds. Default 15 minutes.
+
+    Returns
+    -------
+    pd.DataFrame
+        The frame returned by ``Ticker.history``. Empty results are
+        returned as-is but never cached.
+    """
+    cache_key = f"yf_{ticker}_{period}"
+    cached = get_cached_arrow(cache_key, ttl=cache_ttl)
+    if cached is not None:
+        return cached
+
+    logger.info("Fetching Yahoo Finance history %s (%s)", ticker, period)
+    hist = yf.Ticker(ticker).history(period=period)
+
+    if not hist.empty:
+        set_cached_arrow(cache_key, hist)
+
+    return hist
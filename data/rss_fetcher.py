@@ -7,16 +7,15 @@ Fetches supply chain news from specific high-quality industry RSS feeds.
 import feedparser
 import time
 import logging
-import ssl
+import warnings
+import requests
+import urllib3
+from requests.adapters import HTTPAdapter
 from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 logger = logging.getLogger(__name__)
 
-# Bypass SSL verification for RSS feeds (common issue with some old feed servers or local certs)
-if hasattr(ssl, '_create_unverified_context'):
-    ssl._create_default_https_context = ssl._create_unverified_context
-
 # List of high-quality industry feeds provided by user
 FEED_URLS = [
     # Supply Chain Dive
@@ -38,19 +37,39 @@ FEED_URLS = [
     "https://theloadstar.com/feed/",
 ]
 
+# One worker and one pooled keep-alive connection per feed, so a refresh
+# takes as long as the slowest feed rather than the sum of all of them.
+_MAX_WORKERS = len(FEED_URLS)
+_FEED_TIMEOUT = 10
+_SESSION = requests.Session()
+_SESSION.headers["User-Agent"] = feedparser.USER_AGENT
+_SESSION.mount("https://", HTTPAdapter(pool_connections=_MAX_WORKERS, pool_maxsize=_MAX_WORKERS))
+_SESSION.mount("http://", HTTPAdapter(pool_connections=_MAX_WORKERS, pool_maxsize=_MAX_WORKERS))
+
 def fetch_single_feed(url: str) -> list[dict]:
     """Fetch and parse a single RSS feed."""
     articles = []
     try:
-        # feedparser handles basic HTTP caching/etags automatically if we wanted,
-        # but for now just basic fetch.
-        feed = feedparser.parse(url)
+        # Download through the pooled session (feedparser's own fetch has no
+        # timeout, so one hung server would stall the whole refresh).
+        # Verification is skipped for feeds only (some old feed servers ship
+        # broken certs); the warning is silenced for this request alone.
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", urllib3.exceptions.InsecureRequestWarning)
+            resp = _SESSION.get(url, timeout=_FEED_TIMEOUT, verify=False)
+        resp.raise_for_status()
+        # feedparser looks headers up by lowercase name ('content-type'),
+        # so the case-preserving requests mapping has to be flattened first.
+        headers = {k.lower(): v for k, v in resp.headers.items()}
+        feed = feedparser.parse(resp.content, response_headers=headers)
         
         if feed.bozo:
              logger.warning(f"RSS Parse Warning for {url}: {feed.bozo_exception}")
              # often bozo is just encoding error, usually entries still usable
         
         source_name = feed.feed.get("title", "Industry News")
+        # Shared fallback timestamp for undated entries (one clock read per feed)
+        default_ts = datetime.now().isoformat()
         
         for entry in feed.entries[:10]: # Top 10 per feed to keep it recent
             # Normalize fields
@@ -66,7 +85,7 @@ def fetch_single_feed(url: str) -> list[dict]:
             # Published date
             pub_date = entry.get("published", "")
             if not pub_date:
-                pub_date = entry.get("updated", datetime.now().isoformat())
+                pub_date = entry.get("updated", default_ts)
             
             articles.append({
                 "title": title,
@@ -93,7 +112,7 @@ def fetch_rss_articles(max_items: int = 50) -> list[dict]:
     """
     all_articles = []
     
-    with ThreadPoolExecutor(max_workers=5) as executor:
+    with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
         future_to_url = {executor.submit(fetch_single_feed, url): url for url in FEED_URLS}
         
         for future in as_completed(future_to_url):
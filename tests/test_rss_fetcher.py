@@ -0,0 +1,56 @@
+"""
+RSS Fetcher Tests
+=================
+Parses a canned feed response to check that HTTP headers reach feedparser.
+
+Run with: python tests/test_rss_fetcher.py
+"""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import requests
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from data import rss_fetcher
+
+# windows-1251 body with no XML encoding declaration: only the HTTP charset
+# says how to decode it (feedparser's own fallbacks would produce mojibake).
+_FEED_BODY = (
+    '<?xml version="1.0"?>'
+    '<rss version="2.0"><channel><title>Морской вестник</title>'
+    '<item><title>Задержки в порту</title><link>https://example.com/a</link>'
+    '<description>Очередь судов</description></item>'
+    '</channel></rss>'
+).encode("windows-1251")
+
+
+def _canned_response(url: str, **_kwargs) -> requests.Response:
+    resp = requests.Response()
+    resp.status_code = 200
+    resp.url = url
+    resp._content = _FEED_BODY
+    resp.headers["Content-Type"] = "application/rss+xml; charset=windows-1251"
+    return resp
+
+
+def test_fetch_single_feed_uses_http_charset() -> None:
+    original = rss_fetcher._SESSION.get
+    rss_fetcher._SESSION.get = _canned_response
+    try:
+        articles = rss_fetcher.fetch_single_feed("https://example.com/feed")
+    finally:
+        rss_fetcher._SESSION.get = original
+
+    assert len(articles) == 1
+    assert articles[0]["title"] == "Задержки в порту"
+    assert articles[0]["description"] == "Очередь судов"
+    assert articles[0]["source"] == "Морской вестник"
+
+
+if __name__ == "__main__":
+    test_fetch_single_feed_uses_http_charset()
+    print("OK")